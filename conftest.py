@@ -0,0 +1,22 @@
+"""
+Root pytest configuration
+"""
+
+import importlib.util
+
+
+def pytest_load_initial_conftests(args):
+    """
+    Default to parallel workers when pytest-xdist is installed
+
+    The parser and hook tests are independent calls with no shared mutable
+    state, so they spread cleanly across cores. Work-stealing keeps workers
+    busy despite the mix of sub-millisecond parser cases and multi-second
+    e2e subprocess cases. An explicit -n/--numprocesses on the command line
+    wins, and environments without xdist are unaffected.
+    """
+    if importlib.util.find_spec("xdist") is None:
+        return
+    if any(arg.startswith(("-n", "--numprocesses")) for arg in args):
+        return
+    args[:] = ["-n", "auto", "--dist", "worksteal"] + args
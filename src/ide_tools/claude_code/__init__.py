@@ -4,8 +4,9 @@ Claude Code IDE Handler
 Handles Claude Code-specific hooks and operations.
 """
 
-from .router import route_claude_code_hook
+from .router import route_claude_code_hook, route_claude_code_hook_stream
 
 __all__ = [
     "route_claude_code_hook",
+    "route_claude_code_hook_stream",
 ]
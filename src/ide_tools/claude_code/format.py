@@ -2,10 +2,10 @@
 Claude Code-specific output formatting
 """
 
-import json
 from typing import Optional
 
 from ide_tools.common.hooks.types import OutputFormat
+from modules.utils.json import fast_json_dumps
 
 
 def claude_code_output_formatter(hook_type: str, allowed: bool, user_msg: Optional[str],
@@ -33,7 +33,7 @@ def claude_code_output_formatter(hook_type: str, allowed: bool, user_msg: Option
             result["reason"] = agent_msg or user_msg or "Blocked by security policy"
         # If allowed, return empty dict (allows prompt)
 
-    return json.dumps(result)
+    return fast_json_dumps(result)
 
 
 # Claude Code-specific output format configuration
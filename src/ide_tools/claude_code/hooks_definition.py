@@ -2,6 +2,8 @@
 Claude Code hook definitions
 """
 
+from mcpower_shared.mcp_types import ToolRef
+
 # Hook descriptions based on Claude Code plugin system
 CLAUDE_CODE_HOOKS = {
     "UserPromptSubmit": {
@@ -33,3 +35,29 @@ CLAUDE_CODE_HOOKS = {
         "version": "1.0.0"
     }
 }
+
+# Struct-of-arrays view of the hook table: parallel tuples indexed together.
+# Consumers that only need one field (e.g. rendering a manifest of names) can
+# iterate a flat tuple instead of pulling each inner dict apart.
+CLAUDE_CODE_HOOKS_SOA = {
+    "names": tuple(hook["name"] for hook in CLAUDE_CODE_HOOKS.values()),
+    "descriptions": tuple(hook["description"] for hook in CLAUDE_CODE_HOOKS.values()),
+    "versions": tuple(hook["version"] for hook in CLAUDE_CODE_HOOKS.values()),
+}
+
+# Pre-built at import time - the hook definitions are static, so SessionStart
+# does not need to rebuild the same ToolRef list on every invocation.
+# Built from the SoA view: three flat tuples zipped, no per-hook dict lookups.
+# (Claude Code hooks define no parameters, hence the empty inputSchema.)
+CLAUDE_CODE_TOOL_REFS = [
+    ToolRef(
+        name=name,
+        description=f"Description:\n{description}\n\ninputSchema:\n",
+        version=version
+    )
+    for name, description, version in zip(
+        CLAUDE_CODE_HOOKS_SOA["names"],
+        CLAUDE_CODE_HOOKS_SOA["descriptions"],
+        CLAUDE_CODE_HOOKS_SOA["versions"],
+    )
+]
@@ -5,10 +5,11 @@ Routes Claude Code hook calls to shared handlers with Claude Code-specific confi
 """
 
 import asyncio
-import json
+import os
 import sys
-import uuid
+from typing import Union
 
+from modules.utils.json import fast_json_loads, JSON_DECODE_ERRORS
 from ide_tools.common.hooks.init import handle_init
 from ide_tools.common.hooks.prompt_submit import handle_prompt_submit
 from ide_tools.common.hooks.read_file import handle_read_file
@@ -17,7 +18,7 @@ from ide_tools.common.hooks.types import HookConfig
 from modules.logs.audit_trail import AuditTrailLogger
 from modules.logs.logger import MCPLogger
 from .format import CLAUDE_CODE_OUTPUT
-from .hooks_definition import CLAUDE_CODE_HOOKS
+from .hooks_definition import CLAUDE_CODE_HOOKS, CLAUDE_CODE_TOOL_REFS
 
 # Claude Code-specific configuration
 CLAUDE_CODE_CONFIG = HookConfig(
@@ -27,98 +28,181 @@ CLAUDE_CODE_CONFIG = HookConfig(
     max_content_length=100000
 )
 
-
-def route_claude_code_hook(logger: MCPLogger, audit_logger: AuditTrailLogger, stdin_input: str):
+# Tools handled by the PreToolUse branch (frozensets: hashed O(1) membership,
+# no per-call literal rebuild)
+_READ_GREP_TOOLS = frozenset(("Read", "Grep"))
+_KNOWN_TOOLS = frozenset(("Read", "Grep", "Bash"))
+
+# Pre-encoded allow decision for unknown tools - emitted without any JSON work
+_ALLOW_JSON = b'{"permissionDecision": "allow"}\n'
+
+# Lazily-created event loop reused for all handler invocations in this process.
+# asyncio.run() builds and tears down a fresh loop (selector, signal machinery)
+# on every call - noticeable overhead for a short-lived hook subprocess.
+_event_loop = None
+
+
+def _run_async(coro):
+    """Run a coroutine on the cached event loop, creating it on first use"""
+    global _event_loop
+    if _event_loop is None:
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop.run_until_complete(coro)
+
+
+def _dispatch_session_start(logger, audit_logger, input_data, prompt_id, event_id, cwd):
+    """SessionStart: initialize with the precomputed hook/tool definitions"""
+    _run_async(handle_init(
+        logger=logger,
+        audit_logger=audit_logger,
+        event_id=event_id,
+        cwd=cwd,
+        server_name=CLAUDE_CODE_CONFIG.server_name,
+        client_name="claude-code",
+        hooks=CLAUDE_CODE_HOOKS,
+        tools=CLAUDE_CODE_TOOL_REFS
+    ))
+
+
+def _dispatch_prompt_submit(logger, audit_logger, input_data, prompt_id, event_id, cwd):
+    """UserPromptSubmit: pass the parsed dict as-is - Claude Code provides
+    {prompt}, handler will use empty attachments"""
+    _run_async(handle_prompt_submit(
+        logger, audit_logger, input_data, prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG, "UserPromptSubmit"))
+
+
+def _dispatch_pre_tool_use(logger, audit_logger, input_data, prompt_id, event_id, cwd):
+    """PreToolUse: unwrap tool_input and route by tool_name"""
+    tool_name = input_data.get("tool_name", "")
+
+    # Unknown tools are allowed by default - decide before doing any
+    # unwrap work for the known-tool handlers
+    if tool_name not in _KNOWN_TOOLS:
+        logger.warning("Unknown tool_name in PreToolUse: %s, allowing by default", tool_name)
+        sys.stdout.buffer.write(_ALLOW_JSON)
+        sys.stdout.buffer.flush()
+        sys.exit(0)
+
+    # Claude Code wraps data in tool_input - unwrap it for common handlers
+    # (bind .get once instead of re-resolving the method per field)
+    tool_input_get = (input_data.get("tool_input") or {}).get
+
+    if tool_name in _READ_GREP_TOOLS:
+        # Handler expects {file_path, content, attachments}
+        # Claude Code only provides file_path and content - no attachments
+        unwrapped = {
+            "file_path": tool_input_get("file_path"),
+            "content": tool_input_get("content")
+        }
+        _run_async(handle_read_file(
+            logger, audit_logger, unwrapped, prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG,
+            f"PreToolUse({tool_name})"))
+
+    else:  # Bash
+        # Handler expects {command, cwd}
+        unwrapped = {
+            "command": tool_input_get("command"),
+            "cwd": cwd
+        }
+        _run_async(handle_shell_execution(
+            logger, audit_logger, unwrapped, prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG,
+            f"PreToolUse({tool_name})", is_request=True))
+
+
+# Dispatch table: one hashed lookup replaces the if/elif chain on the event
+# name, and each event's unwrap logic lives in its own wrapper
+_DISPATCH = {
+    "SessionStart": _dispatch_session_start,
+    "UserPromptSubmit": _dispatch_prompt_submit,
+    "PreToolUse": _dispatch_pre_tool_use,
+}
+
+
+def route_claude_code_hook(logger: MCPLogger, audit_logger: AuditTrailLogger, stdin_input: Union[str, bytes],
+                           _loads=fast_json_loads, _exit=sys.exit):
     """
     Route Claude Code hook to appropriate handler
-    
+
     Args:
         logger: MCPLogger instance
         audit_logger: AuditTrailLogger instance
-        stdin_input: Raw input string from stdin (Claude Code format)
+        stdin_input: Raw input from stdin, str or bytes (Claude Code format)
+        _loads: Default-arg binding of the JSON parser (LOAD_FAST vs LOAD_GLOBAL)
+        _exit: Default-arg binding of sys.exit
     """
     try:
-        input_data = json.loads(stdin_input)
+        input_data = _loads(stdin_input)
 
         hook_event_name = input_data.get("hook_event_name")
         if not hook_event_name:
             logger.error("Missing required field 'hook_event_name' in input")
-            sys.exit(1)
+            _exit(1)
 
         # Extract IDs from Claude Code input
         session_id = input_data.get("session_id")
         if not session_id:
             logger.error("Missing required field 'session_id' in input")
-            sys.exit(1)
+            _exit(1)
 
         cwd = input_data.get("cwd")
         if not cwd:
             logger.error("Missing required field 'cwd' in input")
-            sys.exit(1)
+            _exit(1)
 
         # Generate consistent IDs for logging
+        # (4 random bytes -> 8 hex chars; cheaper than building a full UUID)
         prompt_id = session_id[:8]
-        event_id = uuid.uuid4().hex[:8]
+        event_id = os.urandom(4).hex()
 
+        # Lazy %-formatting: the string is only built if INFO is enabled
         logger.info(
-            f"Claude Code router: routing to {hook_event_name} handler "
-            f"(prompt_id={prompt_id}, event_id={event_id}, cwd={cwd})")
-
-        # Route to appropriate handler
-        if hook_event_name == "SessionStart":
-            asyncio.run(handle_init(
-                logger=logger,
-                audit_logger=audit_logger,
-                event_id=event_id,
-                cwd=cwd,
-                server_name=CLAUDE_CODE_CONFIG.server_name,
-                client_name="claude-code",
-                hooks=CLAUDE_CODE_HOOKS
-            ))
-
-        elif hook_event_name == "UserPromptSubmit":
-            # Pass as-is - Claude Code provides {prompt}, handler will use empty attachments
-            asyncio.run(handle_prompt_submit(
-                logger, audit_logger, stdin_input, prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG, "UserPromptSubmit"))
-
-        elif hook_event_name == "PreToolUse":
-            # Claude Code wraps data in tool_input - unwrap it for common handlers
-            tool_name = input_data.get("tool_name", "")
-            tool_input = input_data.get("tool_input", {})
-
-            if tool_name in ["Read", "Grep"]:
-                # Handler expects {file_path, content, attachments}
-                # Claude Code only provides file_path and content - no attachments
-                unwrapped = {
-                    "file_path": tool_input.get("file_path"),
-                    "content": tool_input.get("content")
-                }
-                asyncio.run(handle_read_file(
-                    logger, audit_logger, json.dumps(unwrapped), prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG,
-                    f"PreToolUse({tool_name})"))
-
-            elif tool_name == "Bash":
-                # Handler expects {command, cwd}
-                unwrapped = {
-                    "command": tool_input.get("command"),
-                    "cwd": cwd
-                }
-                asyncio.run(handle_shell_execution(
-                    logger, audit_logger, json.dumps(unwrapped), prompt_id, event_id, cwd, CLAUDE_CODE_CONFIG,
-                    f"PreToolUse({tool_name})", is_request=True))
-
-            else:
-                logger.warning(f"Unknown tool_name in PreToolUse: {tool_name}, allowing by default")
-                print(json.dumps({"permissionDecision": "allow"}), flush=True)
-                sys.exit(0)
-
-        else:
-            logger.error(f"Unknown hook_event_name: {hook_event_name}")
-            sys.exit(1)
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse input JSON: {e}")
-        sys.exit(1)
+            "Claude Code router: routing to %s handler (prompt_id=%s, event_id=%s, cwd=%s)",
+            hook_event_name, prompt_id, event_id, cwd)
+
+        # Route to appropriate handler via the dispatch table
+        handler = _DISPATCH.get(hook_event_name)
+        if handler is None:
+            logger.error("Unknown hook_event_name: %s", hook_event_name)
+            _exit(1)
+
+        handler(logger, audit_logger, input_data, prompt_id, event_id, cwd)
+
+    except JSON_DECODE_ERRORS as e:
+        logger.error("Failed to parse input JSON: %s", e)
+        _exit(1)
+    except (KeyError, TypeError, ValueError) as e:
+        # Expected shape/type failures on malformed input - no need to capture
+        # and format the whole traceback for these
+        logger.error("Routing validation error: %s", e)
+        _exit(1)
     except Exception as e:
-        logger.error(f"Routing error: {e}", exc_info=True)
-        sys.exit(1)
+        # Last resort - unexpected errors keep the full traceback
+        logger.error("Routing error: %s", e, exc_info=True)
+        _exit(1)
+
+
+def route_claude_code_hook_stream(logger: MCPLogger, audit_logger: AuditTrailLogger):
+    """
+    Daemon-style loop: one newline-delimited JSON hook request per stdin line,
+    one reply line per request. Reusing a single process amortizes interpreter
+    startup, import graph, and event-loop setup across invocations.
+
+    Handlers finish each request with sys.exit, so SystemExit is caught to
+    keep the loop alive; the exit code is only logged (replies carry the
+    decision in-band).
+
+    Args:
+        logger: MCPLogger instance
+        audit_logger: AuditTrailLogger instance
+    """
+    logger.info("Claude Code router: daemon mode started")
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            route_claude_code_hook(logger, audit_logger, line)
+        except SystemExit as e:
+            logger.info("Hook request completed (exit code %s)", e.code)
+    logger.info("Claude Code router: daemon mode stdin closed, exiting")
@@ -6,6 +6,7 @@ Base test utilities for testing Claude Code hook handlers
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 
 logging.basicConfig(level=logging.WARNING, format='%(message)s')
@@ -29,13 +30,24 @@ def assert_success(result: Dict[str, Any], message: str = "Handler should succee
     assert_exit_code(result, 0, message)
 
 
-def get_command():
+def run_tests_concurrently(*tests):
     """
-    Get uvx command for running a Claude Code IDE tool handler
-    
-    Returns:
-        Tuple of (command list, repo_root path)
+    Run independent test functions concurrently and re-raise the first failure.
+
+    Each handler test blocks on a fresh uvx subprocess (interpreter startup
+    dominates), so threads overlap that wait instead of paying it serially.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test) for test in tests]
+        for future in futures:
+            future.result()
+
+
+@lru_cache(maxsize=1)
+def _resolve_command():
+    """Resolve the uvx command and repo root once - the paths never change"""
     from pathlib import Path
 
     # Get repo root for uvx command
@@ -45,12 +57,71 @@ def get_command():
     src_dir = ide_tools_dir.parent
     repo_root = src_dir.parent
 
-    command = [
+    command = (
         "uvx",
         "--from",
         str(repo_root),
         "defenter-proxy",
         "--ide-tool",
         "--ide", "claude-code",
-    ]
+    )
     return command, repo_root
+
+
+def get_command():
+    """
+    Get uvx command for running a Claude Code IDE tool handler
+
+    Returns:
+        Tuple of (command list, repo_root path)
+    """
+    command, repo_root = _resolve_command()
+    return list(command), repo_root
+
+
+class HandlerSession:
+    """
+    Persistent handler subprocess shared across test cases.
+
+    Spawns the router once in daemon mode (--context daemon) and exchanges one
+    newline-delimited JSON request/reply pair per call, so each case skips the
+    uvx + interpreter startup that dominates single-shot runs. Replies carry
+    the decision in-band - daemon mode has no per-request exit code, so this
+    suits cases asserting on output rather than return codes.
+    """
+
+    def __init__(self):
+        import subprocess
+        import threading
+
+        from ide_tools.common.tests.runner import handler_env
+
+        command, _ = get_command()
+        self.process = subprocess.Popen(
+            command + ["--context", "daemon"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=handler_env(),
+        )
+        # Serializes write/readline pairs so concurrent tests sharing the
+        # session cannot interleave requests and replies
+        self._lock = threading.Lock()
+
+    def request(self, stdin_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one hook request and return the parsed JSON reply"""
+        import json
+
+        with self._lock:
+            self.process.stdin.write(json.dumps(stdin_input).encode('utf-8') + b"\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("Handler daemon exited without replying")
+        return json.loads(line)
+
+    def close(self):
+        """Close stdin so the daemon loop exits, then reap the process"""
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait(timeout=10)
@@ -25,11 +25,21 @@ Output (from docs):
 import sys
 import uuid
 
-from common import (
-    assert_success,
-    get_command,
-    assert_exit_code
-)
+# Package-relative when collected by pytest, bare import when run as a script
+try:
+    from .common import (
+        assert_success,
+        get_command,
+        assert_exit_code,
+        run_tests_concurrently
+    )
+except ImportError:
+    from common import (
+        assert_success,
+        get_command,
+        assert_exit_code,
+        run_tests_concurrently
+    )
 from ide_tools.common.tests.asserts import assert_json_output
 from ide_tools.common.tests.runner import run_handler
 from modules.utils.string import truncate_at
@@ -203,11 +213,13 @@ def test_pre_tool_use_bash_invalid_json():
 
 if __name__ == "__main__":
     try:
-        test_pre_tool_use_bash_safe_command()
-        test_pre_tool_use_bash_dangerous_command()
-        test_pre_tool_use_bash_network_command()
-        test_pre_tool_use_bash_missing_command()
-        test_pre_tool_use_bash_invalid_json()
+        run_tests_concurrently(
+            test_pre_tool_use_bash_safe_command,
+            test_pre_tool_use_bash_dangerous_command,
+            test_pre_tool_use_bash_network_command,
+            test_pre_tool_use_bash_missing_command,
+            test_pre_tool_use_bash_invalid_json,
+        )
 
         print("\n" + "=" * 50)
         print("All PreToolUse(Bash) handler tests passed! ✓")
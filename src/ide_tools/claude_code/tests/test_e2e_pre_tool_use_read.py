@@ -26,11 +26,21 @@ Output (from docs):
 import sys
 import uuid
 
-from common import (
-    assert_success,
-    get_command,
-    assert_exit_code
-)
+# Package-relative when collected by pytest, bare import when run as a script
+try:
+    from .common import (
+        assert_success,
+        get_command,
+        assert_exit_code,
+        run_tests_concurrently
+    )
+except ImportError:
+    from common import (
+        assert_success,
+        get_command,
+        assert_exit_code,
+        run_tests_concurrently
+    )
 from ide_tools.common.tests.asserts import assert_json_output
 from ide_tools.common.tests.runner import run_handler
 from modules.utils.string import truncate_at
@@ -193,11 +203,13 @@ def test_pre_tool_use_read_invalid_json():
 
 if __name__ == "__main__":
     try:
-        test_pre_tool_use_read_allow()
-        test_pre_tool_use_read_deny()
-        test_pre_tool_use_read_missing_file_path()
-        test_pre_tool_use_read_missing_tool_input()
-        test_pre_tool_use_read_invalid_json()
+        run_tests_concurrently(
+            test_pre_tool_use_read_allow,
+            test_pre_tool_use_read_deny,
+            test_pre_tool_use_read_missing_file_path,
+            test_pre_tool_use_read_missing_tool_input,
+            test_pre_tool_use_read_invalid_json,
+        )
 
         print("\n" + "=" * 50)
         print("All PreToolUse(Read) handler tests passed! ✓")
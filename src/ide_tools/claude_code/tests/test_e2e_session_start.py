@@ -15,23 +15,28 @@ Input schema (from docs):
 Output: Exit 0 with stdout captured as context for Claude
 """
 
-import sys
 import uuid
 
-from common import (
-    assert_success,
-    get_command,
-    assert_exit_code
-)
+# Package-relative when collected by pytest, bare import when run as a script
+try:
+    from .common import (
+        assert_success,
+        assert_exit_code
+    )
+except ImportError:
+    from common import (
+        assert_success,
+        assert_exit_code
+    )
 from ide_tools.common.tests.runner import run_handler
 from modules.utils.string import truncate_at
 
 
-def test_session_start_valid_input():
+def test_session_start_valid_input(command_and_root):
     """Test SessionStart with valid input - should succeed and capture stdout"""
     print("Testing SessionStart with valid input...")
 
-    command, repo_root = get_command()
+    command, repo_root = command_and_root
 
     # Valid input per docs
     stdin_input = {
@@ -51,11 +56,11 @@ def test_session_start_valid_input():
         print(f"  Stdout (captured as context): {truncate_at(result['stdout'], 100)}")
 
 
-def test_session_start_missing_session_id():
+def test_session_start_missing_session_id(command_and_root):
     """Test SessionStart with missing session_id - should fail with exit 1"""
     print("\nTesting SessionStart with missing session_id...")
 
-    command, repo_root = get_command()
+    command, repo_root = command_and_root
 
     # Missing required 'session_id' field
     stdin_input = {
@@ -72,11 +77,11 @@ def test_session_start_missing_session_id():
     print(f"✓ SessionStart correctly failed with exit code 1")
 
 
-def test_session_start_missing_cwd():
+def test_session_start_missing_cwd(command_and_root):
     """Test SessionStart with missing cwd - should fail with exit 1"""
     print("\nTesting SessionStart with missing cwd...")
 
-    command, repo_root = get_command()
+    command, repo_root = command_and_root
 
     # Missing required 'cwd' field
     stdin_input = {
@@ -93,51 +98,18 @@ def test_session_start_missing_cwd():
     print(f"✓ SessionStart correctly failed with exit code 1")
 
 
-def test_session_start_invalid_json():
+def test_session_start_invalid_json(command_and_root):
     """Test SessionStart with invalid JSON input - should fail with exit 1"""
     print("\nTesting SessionStart with invalid JSON...")
 
-    command, repo_root = get_command()
-
-    # Send invalid JSON via process stdin
-    import subprocess
-    import os
-
-    process = subprocess.Popen(
-        command,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env={**os.environ, "DEFENTER_DEBUG": "1"},
-    )
-
-    try:
-        stdout_data, stderr_data = process.communicate(input=b"not valid json", timeout=60)
-
-        # Should fail with exit 1
-        assert process.returncode == 1, f"Expected exit code 1, got {process.returncode}"
-
-        print(f"✓ SessionStart correctly failed with exit code 1 for invalid JSON")
-
-    except subprocess.TimeoutExpired:
-        process.kill()
-        raise TimeoutError("Handler did not complete within timeout")
+    command, repo_root = command_and_root
 
+    # Send invalid JSON through the shared runner
+    result = run_handler(command, stdin_raw=b"not valid json", timeout=60)
 
-if __name__ == "__main__":
-    try:
-        test_session_start_valid_input()
-        test_session_start_missing_session_id()
-        test_session_start_missing_cwd()
-        test_session_start_invalid_json()
+    # Should fail with exit 1
+    assert_exit_code(result, 1, "SessionStart should exit 1 for invalid JSON")
 
-        print("\n" + "=" * 50)
-        print("All SessionStart handler tests passed! ✓")
-        print("=" * 50)
+    print(f"✓ SessionStart correctly failed with exit code 1 for invalid JSON")
 
-    except Exception as e:
-        print(f"\nTest failed: {e}")
-        import traceback
 
-        traceback.print_exc()
-        sys.exit(1)
@@ -5,7 +5,7 @@ Registers IDE hooks with the security API.
 """
 
 import sys
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from mcpower_shared.mcp_types import InitRequest, EnvironmentContext, ServerRef, ToolRef
 from modules.apis.security_policy import SecurityPolicyClient
@@ -41,11 +41,12 @@ async def handle_init(
         cwd: Optional[str],
         server_name: str,
         client_name: str,
-        hooks: Dict[str, Dict[str, str]]
+        hooks: Dict[str, Dict[str, str]],
+        tools: Optional[List[ToolRef]] = None
 ) -> None:
     """
     Generic init handler - registers hooks with security API
-    
+
     Args:
         logger: Logger instance
         audit_logger: Audit logger instance
@@ -55,7 +56,8 @@ async def handle_init(
         server_name: IDE-specific server name (e.g. "cursor_tools_mcp")
         client_name: IDE-specific client name (e.g. "cursor", "claude-code")
         hooks: Dict of hook definitions with {name, description, version}
-        
+        tools: Optional pre-built ToolRef list (skips rebuilding from hooks)
+
     Outputs result and exits with appropriate code.
     """
     session_id = get_session_id()
@@ -76,15 +78,16 @@ async def handle_init(
         )
 
         try:
-            tools = [
-                ToolRef(
-                    name=hook_info["name"],
-                    description=f"Description:\n{hook_info['description']}\n\n"
-                                f"inputSchema:\n{hook_info['parameters']}",
-                    version=hook_info["version"]
-                )
-                for hook_info in hooks.values()
-            ]
+            if tools is None:
+                tools = [
+                    ToolRef(
+                        name=hook_info["name"],
+                        description=f"Description:\n{hook_info['description']}\n\n"
+                                    f"inputSchema:\n{hook_info['parameters']}",
+                        version=hook_info["version"]
+                    )
+                    for hook_info in hooks.values()
+                ]
 
             init_request = InitRequest(
                 environment=EnvironmentContext(
@@ -9,6 +9,12 @@ from modules.logs.logger import MCPLogger
 from .types import OutputFormat
 
 
+def _write_output(formatted_output: str) -> None:
+    """Emit one output line as a single buffered write, bypassing the text layer"""
+    sys.stdout.buffer.write(formatted_output.encode() + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def output_result(
         logger: MCPLogger,
         output_format: OutputFormat,
@@ -32,7 +38,7 @@ def output_result(
     formatted_output = output_format.formatter(hook_type, allowed, user_message, agent_message)
 
     logger.info(f"Hook output ({hook_type}, allowed={allowed}): {formatted_output}")
-    print(formatted_output, flush=True)
+    _write_output(formatted_output)
 
     # Exit with appropriate code
     exit_code = output_format.allow_exit_code if allowed else output_format.deny_exit_code
@@ -58,6 +64,6 @@ def output_error(
 
     # Output as deny/block with error message
     formatted_output = output_format.formatter(hook_type, False, error_message, error_message)
-    print(formatted_output, flush=True)
+    _write_output(formatted_output)
 
     sys.exit(output_format.error_exit_code)
@@ -2,7 +2,7 @@
 Shared logic for UserPromptSubmit hook
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 from modules.logs.audit_trail import AuditTrailLogger
 from modules.logs.logger import MCPLogger
@@ -13,11 +13,18 @@ from .output import output_result, output_error
 from .types import HookConfig
 from .utils import create_validator, extract_redaction_patterns, process_attachments_for_redaction, inspect_and_enforce
 
+# Field spec never changes - build the validator once at import instead of
+# per invocation
+_PROMPT_VALIDATOR = create_validator(
+    required_fields={"prompt": str},
+    optional_fields={"attachments": list}
+)
+
 
 async def handle_prompt_submit(
         logger: MCPLogger,
         audit_logger: AuditTrailLogger,
-        stdin_input: str,
+        stdin_input: Union[str, bytes],
         prompt_id: str,
         event_id: str,
         cwd: Optional[str],
@@ -30,7 +37,7 @@ async def handle_prompt_submit(
     Args:
         logger: Logger instance
         audit_logger: Audit logger instance
-        stdin_input: Raw JSON input
+        stdin_input: Raw JSON input (str or bytes)
         prompt_id: Prompt/conversation ID
         event_id: Event/generation ID
         cwd: Current working directory
@@ -47,11 +54,7 @@ async def handle_prompt_submit(
 
     try:
         try:
-            validator = create_validator(
-                required_fields={"prompt": str},
-                optional_fields={"attachments": list}
-            )
-            input_data = validator(stdin_input)
+            input_data = _PROMPT_VALIDATOR(stdin_input)
             prompt = input_data["prompt"]
             attachments = input_data.get("attachments", [])
         except ValueError as e:
@@ -2,7 +2,9 @@
 Shared logic for beforeReadFile/PreReadFile hook
 """
 
-from typing import Optional
+import asyncio
+import functools
+from typing import Any, Dict, Optional, Union
 
 from modules.logs.audit_trail import AuditTrailLogger
 from modules.logs.logger import MCPLogger
@@ -12,11 +14,18 @@ from .output import output_result, output_error
 from .types import HookConfig
 from .utils import create_validator, process_attachments_for_redaction, inspect_and_enforce
 
+# Field spec never changes - build the validator once at import instead of
+# per invocation
+_READ_FILE_VALIDATOR = create_validator(
+    required_fields={"file_path": str, "content": str},
+    optional_fields={"attachments": list}
+)
+
 
 async def handle_read_file(
         logger: MCPLogger,
         audit_logger: AuditTrailLogger,
-        stdin_input: str,
+        stdin_input: Union[str, bytes, Dict[str, Any]],
         prompt_id: str,
         event_id: str,
         cwd: Optional[str],
@@ -25,11 +34,11 @@ async def handle_read_file(
 ) -> None:
     """
     Shared handler for file read hooks
-    
+
     Args:
         logger: Logger instance
         audit_logger: Audit logger instance
-        stdin_input: Raw JSON input
+        stdin_input: Raw JSON input (str or bytes) or already-parsed input dict
         prompt_id: Prompt/conversation ID
         event_id: Event/generation ID
         cwd: Current working directory
@@ -45,11 +54,7 @@ async def handle_read_file(
 
     try:
         try:
-            validator = create_validator(
-                required_fields={"file_path": str, "content": str},
-                optional_fields={"attachments": list}
-            )
-            input_data = validator(stdin_input)
+            input_data = _READ_FILE_VALIDATOR(stdin_input)
             file_path = input_data["file_path"]
             provided_content = input_data["content"]
             attachments = input_data.get("attachments", [])
@@ -58,33 +63,31 @@ async def handle_read_file(
             output_error(logger, config.output_format, "permission", str(e))
             return
 
-        audit_logger.log_event(
-            "agent_request",
-            {
-                "server": config.server_name,
-                "tool": tool_name,
-                "params": {"file_path": file_path, "attachments_count": len(attachments)}
-            },
-            event_id=event_id,
-            prompt_id=prompt_id
-        )
+        request_audit_data = {
+            "server": config.server_name,
+            "tool": tool_name,
+            "params": {"file_path": file_path, "attachments_count": len(attachments)}
+        }
 
-        # Check content length - skip API if too large
+        # Check content length - skip API if too large; both events are known
+        # up front on this path, so write them under one audit flush
         if len(provided_content) > config.max_content_length:
             logger.info(f"Content length ({len(provided_content)} chars) exceeds max ({config.max_content_length}) - "
                         f"skipping API call")
 
-            audit_logger.log_event(
-                "agent_request_forwarded",
-                {
-                    "server": config.server_name,
-                    "tool": tool_name,
-                    "params": {
-                        "file_path": file_path,
-                        "content_length": len(provided_content),
-                        "content_too_large": True
-                    }
-                },
+            audit_logger.log_events(
+                [
+                    ("agent_request", request_audit_data),
+                    ("agent_request_forwarded", {
+                        "server": config.server_name,
+                        "tool": tool_name,
+                        "params": {
+                            "file_path": file_path,
+                            "content_length": len(provided_content),
+                            "content_too_large": True
+                        }
+                    })
+                ],
                 event_id=event_id,
                 prompt_id=prompt_id
             )
@@ -92,6 +95,19 @@ async def handle_read_file(
             output_result(logger, config.output_format, "permission", True)
             return
 
+        # Offload the incoming-event audit write so it overlaps with the
+        # redaction work and policy API call instead of blocking before them
+        audit_future = asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                audit_logger.log_event,
+                "agent_request",
+                request_audit_data,
+                event_id=event_id,
+                prompt_id=prompt_id
+            )
+        )
+
         # Redact the main content
         redacted_content = redact(provided_content)
 
@@ -121,21 +137,27 @@ async def handle_read_file(
 
         # Call security API and enforce decision
         try:
-            decision = await inspect_and_enforce(
-                is_request=True,
-                session_id=session_id,
-                logger=logger,
-                audit_logger=audit_logger,
-                app_uid=app_uid,
-                event_id=event_id,
-                server_name=config.server_name,
-                tool_name=tool_name,
-                content_data=content_data,
-                prompt_id=prompt_id,
-                cwd=cwd,
-                current_files=[file_path],
-                client_name=config.client_name
-            )
+            try:
+                decision = await inspect_and_enforce(
+                    is_request=True,
+                    session_id=session_id,
+                    logger=logger,
+                    audit_logger=audit_logger,
+                    app_uid=app_uid,
+                    event_id=event_id,
+                    server_name=config.server_name,
+                    tool_name=tool_name,
+                    content_data=content_data,
+                    prompt_id=prompt_id,
+                    cwd=cwd,
+                    current_files=[file_path],
+                    client_name=config.client_name
+                )
+            finally:
+                # The incoming event must land before its forwarded
+                # counterpart, and the deny/exception path must not return
+                # while the offloaded write is still in flight
+                await audit_future
 
             audit_logger.log_event(
                 "agent_request_forwarded",
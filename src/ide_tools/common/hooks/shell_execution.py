@@ -4,8 +4,10 @@ Common shell execution handler - IDE-agnostic
 Handles both request (before) and response (after) inspection for shell commands.
 """
 
+import asyncio
+import functools
 import os
-from typing import Optional, Dict, List, Tuple
+from typing import Any, Optional, Dict, List, Tuple, Union
 
 from modules.logs.audit_trail import AuditTrailLogger
 from modules.logs.logger import MCPLogger
@@ -16,6 +18,11 @@ from .shell_parser_bashlex import parse_shell_command
 from .types import HookConfig
 from .utils import create_validator, inspect_and_enforce
 
+# Field specs are static per direction - build both validators once at import
+# instead of per invocation
+_REQUEST_VALIDATOR = create_validator(required_fields={"command": str, "cwd": str})
+_RESPONSE_VALIDATOR = create_validator(required_fields={"command": str, "output": str})
+
 
 def extract_and_redact_command_files(
         command: str,
@@ -118,7 +125,7 @@ def extract_and_redact_command_files(
 async def handle_shell_execution(
         logger: MCPLogger,
         audit_logger: AuditTrailLogger,
-        stdin_input: str,
+        stdin_input: Union[str, bytes, Dict[str, Any]],
         prompt_id: str,
         event_id: str,
         cwd: Optional[str],
@@ -132,7 +139,7 @@ async def handle_shell_execution(
     Args:
         logger: Logger instance
         audit_logger: Audit logger instance
-        stdin_input: Raw input string from stdin
+        stdin_input: Raw input from stdin (str or bytes) or already-parsed input dict
         prompt_id: Prompt identifier
         event_id: Event identifier
         cwd: Current working directory
@@ -161,7 +168,7 @@ async def handle_shell_execution(
 async def _handle_shell_operation(
         logger: MCPLogger,
         audit_logger: AuditTrailLogger,
-        stdin_input: str,
+        stdin_input: Union[str, bytes, Dict[str, Any]],
         prompt_id: str,
         event_id: str,
         cwd: Optional[str],
@@ -194,7 +201,7 @@ async def _handle_shell_operation(
 
     try:
         try:
-            validator = create_validator(required_fields=required_fields)
+            validator = _REQUEST_VALIDATOR if is_request else _RESPONSE_VALIDATOR
             input_data = validator(stdin_input)
         except ValueError as e:
             logger.error(f"Input validation error: {e}")
@@ -223,29 +230,35 @@ async def _handle_shell_operation(
             if packages:
                 logger.info(f"Extracted packages from command: {packages}")
 
-        def get_audit_data():
-            # Use different structure for request vs response events
-            # Requests: params nested, Responses: unpacked at root
-            if is_request:
-                return {
-                    "server": config.server_name,
-                    "tool": tool_name,
-                    "params": redacted_data,
-                    "files": list(files_dict.keys()) if files_dict else None,
-                    "packages": packages
-                }
-            else:
-                return {
-                    "server": config.server_name,
-                    "tool": tool_name,
-                    **redacted_data
-                }
-
-        audit_logger.log_event(
-            audit_event_type,
-            get_audit_data(),
-            event_id=event_id,
-            prompt_id=prompt_id
+        # Use different structure for request vs response events
+        # Requests: params nested, Responses: unpacked at root
+        # (built once - both audit events log the same data)
+        if is_request:
+            audit_data = {
+                "server": config.server_name,
+                "tool": tool_name,
+                "params": redacted_data,
+                "files": list(files_dict.keys()) if files_dict else None,
+                "packages": packages
+            }
+        else:
+            audit_data = {
+                "server": config.server_name,
+                "tool": tool_name,
+                **redacted_data
+            }
+
+        # Offload the incoming-event audit write so it overlaps with the
+        # policy API call instead of blocking the event loop before it
+        audit_future = asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                audit_logger.log_event,
+                audit_event_type,
+                audit_data,
+                event_id=event_id,
+                prompt_id=prompt_id
+            )
         )
 
         # Build content_data with redacted fields and files
@@ -256,24 +269,30 @@ async def _handle_shell_operation(
             content_data["packages"] = packages
 
         try:
-            decision = await inspect_and_enforce(
-                is_request=is_request,
-                session_id=session_id,
-                logger=logger,
-                audit_logger=audit_logger,
-                app_uid=app_uid,
-                event_id=event_id,
-                server_name=config.server_name,
-                tool_name=tool_name,
-                content_data=content_data,
-                prompt_id=prompt_id,
-                cwd=cwd,
-                client_name=config.client_name
-            )
+            try:
+                decision = await inspect_and_enforce(
+                    is_request=is_request,
+                    session_id=session_id,
+                    logger=logger,
+                    audit_logger=audit_logger,
+                    app_uid=app_uid,
+                    event_id=event_id,
+                    server_name=config.server_name,
+                    tool_name=tool_name,
+                    content_data=content_data,
+                    prompt_id=prompt_id,
+                    cwd=cwd,
+                    client_name=config.client_name
+                )
+            finally:
+                # The incoming event must land before its forwarded
+                # counterpart, and the deny/exception path must not return
+                # while the offloaded write is still in flight
+                await audit_future
 
             audit_logger.log_event(
                 audit_forwarded_event_type,
-                get_audit_data(),
+                audit_data,
                 event_id=event_id,
                 prompt_id=prompt_id
             )
@@ -5,10 +5,26 @@ Parses shell commands to extract sub-commands, file references, and package exec
 using proper bash parsing.
 """
 
+import functools
 import os
-from typing import List, Set, Optional, Dict
+import re
+import sys
+from collections import defaultdict
+from typing import Any, List, Set, Optional, Dict
 
-import bashlex
+# bashlex builds its yacc grammar tables the first time it is imported -
+# the single biggest startup cost for a short-lived hook process. The import
+# is deferred until a command actually needs the full parser; the fast-path
+# scanner and plain tokenization cover most hook traffic without it.
+bashlex = None
+
+
+def _load_bashlex():
+    global bashlex
+    if bashlex is None:
+        import bashlex as _bashlex
+        bashlex = _bashlex
+    return bashlex
 
 # Comprehensive mapping of package execution tools to their ecosystems
 # Format: (tool_command, ecosystem)
@@ -207,6 +223,68 @@ PACKAGE_TOOL_MAPPINGS = [
 # Sort by number of words (descending) to match longer patterns first
 PACKAGE_TOOL_MAPPINGS.sort(key=lambda x: len(x[0].split()), reverse=True)
 
+# Dispatch index built once at import: first word of each tool pattern ->
+# its candidate mappings, longest pattern first. Most commands start with
+# a word that is no package tool at all, so one dict lookup replaces a
+# linear scan over every mapping. Ecosystem tags are interned - they are
+# reused as dict keys in every result - so key comparisons short-circuit
+# on identity
+_PACKAGE_TOOLS_BY_FIRST_WORD: Dict[str, List] = {}
+for _pattern, _ecosystem in PACKAGE_TOOL_MAPPINGS:
+    _tool_tokens = _pattern.split()
+    _PACKAGE_TOOLS_BY_FIRST_WORD.setdefault(sys.intern(_tool_tokens[0]), []).append(
+        (_tool_tokens, _pattern, sys.intern(_ecosystem))
+    )
+del _pattern, _ecosystem, _tool_tokens
+
+
+# Token-classification tables, built once at import instead of per call -
+# these heuristics run on every token of every scanned command
+_SHELL_CONSTRUCTS = frozenset(('&&', '||', '|', '>', '<', '>>', '<<'))
+
+# Common commands that are never packages when standalone
+_COMMON_COMMANDS = frozenset((
+    'test', 'start', 'dev', 'prod', 'serve', 'watch',
+    'lint', 'format', 'check', 'clean', 'deploy'
+))
+
+# Characters that mark a token as package-like (scoped/versioned names,
+# URLs, Docker images, Nix attrs, build targets, pip extras)
+_PACKAGE_CHARS = re.compile(r'[@/:\-_.#+\[\]]')
+
+# Commands that take directory arguments, not files
+_DIRECTORY_COMMANDS = frozenset((
+    'cd', 'pushd', 'popd', 'mkdir', 'rmdir', 'chdir',
+))
+
+# Single alternation covering the non-file markers that each used to be a
+# separate pass over the word: URL schemes, glob patterns, variables, and
+# command substitution
+_NON_FILE_MARKERS = re.compile(r'://|[*?\[\]$`]')
+
+# Characters that make plain str.split unsafe as a stand-in for
+# bashlex.split: quoting, escapes, expansions, comments, and redirect
+# operators (bashlex tokenizes 2> differently from whitespace split)
+_SPLIT_UNSAFE = re.compile(r'["\'`$\\#<>]')
+
+# Bare directories that are never files themselves (but /tmp/file is OK)
+_BARE_DIRECTORIES = frozenset(('/', '/tmp', '/dev', '/usr', '/etc', '/var', '/opt', '/home'))
+
+# Well-known files without extensions (matched case-insensitively)
+_KNOWN_FILENAMES = frozenset((
+    'makefile', 'readme', 'license', 'dockerfile',
+    'gemfile', 'rakefile', 'procfile', 'vagrantfile',
+    'jenkinsfile', 'cakefile', 'gulpfile', 'gruntfile',
+    'brewfile', 'berksfile', 'guardfile', 'fastfile',
+    'cartfile', 'appfile', 'podfile', 'snapfile',
+))
+
+# Well-known executable names without extensions
+_KNOWN_EXECUTABLES = frozenset((
+    'script', 'run', 'build', 'test', 'deploy', 'install',
+    'configure', 'setup', 'bootstrap', 'init',
+))
+
 
 def _is_package_like(token: str) -> bool:
     """
@@ -227,7 +305,7 @@ def _is_package_like(token: str) -> bool:
     - Shell constructs
     """
     # Exclude shell constructs
-    if token in ('&&', '||', '|', '>', '<', '>>', '<<'):
+    if token in _SHELL_CONSTRUCTS:
         return False
     
     # Exclude flags
@@ -250,12 +328,7 @@ def _is_package_like(token: str) -> bool:
     if token.startswith('file://'):
         return True
     
-    # Common commands that are never packages when standalone
-    common_commands = {
-        'test', 'start', 'dev', 'prod', 'serve', 'watch',
-        'lint', 'format', 'check', 'clean', 'deploy'
-    }
-    if token.lower() in common_commands:
+    if token.lower() in _COMMON_COMMANDS:
         return False
     
     # Pure version numbers aren't packages (e.g., "2.0.0")
@@ -263,7 +336,7 @@ def _is_package_like(token: str) -> bool:
         return False
     
     # Looks like a package if it contains package-like patterns
-    if any(c in token for c in ['@', '/', ':', '-', '_', '.', '#', '+', '[', ']']):
+    if _PACKAGE_CHARS.search(token):
         return True
     
     # Or if it's a simple name (alphanumeric, possibly with - or _)
@@ -372,26 +445,56 @@ def _extract_packages_from_commands(sub_commands: List[str]) -> Dict[str, List[s
         Dictionary mapping ecosystem names to lists of package names
         Example: {"node": ["prettier", "eslint", "@babel/core"], "python": ["ruff"]}
     """
-    packages: Dict[str, List[str]] = {}
-    
+    # Per-ecosystem accumulators are dicts used as insertion-ordered sets:
+    # O(1) dedupe instead of a list scan per package, converted to lists
+    # only at return
+    packages: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+    # Extraction is deterministic and results merge idempotently, so a
+    # sub-command repeated within one line (npx a && npx a) is only
+    # tokenized and matched once
+    seen: Set[str] = set()
     for command in sub_commands:
-        # Use bashlex.split() to handle quoted strings properly
-        try:
-            tokens = list(bashlex.split(command))
-        except (ValueError, bashlex.errors.ParsingError):
-            # If bashlex fails (unclosed quotes, etc.), fall back to simple split
+        if command in seen:
+            continue
+        seen.add(command)
+
+        # Peek at the raw first word before paying for tokenization: most
+        # sub-commands (grep, sort, tee, ...) can never yield packages.
+        # Quotes are stripped to match the tokenizer's word values;
+        # backslashes could make the raw word diverge from the real first
+        # token, so those rare commands take the full path
+        split_head = command.split(None, 1)
+        first = split_head[0] if split_head else ''
+        if '\\' not in first:
+            if '"' in first or "'" in first:
+                first = _QUOTE_CHARS.sub('', first)
+            if first.lower() not in _PACKAGE_TOOLS_BY_FIRST_WORD:
+                continue
+
+        # Plain whitespace split is exact when nothing needs quote-aware
+        # tokenization; bashlex.split() handles the rest
+        if not _SPLIT_UNSAFE.search(command):
             tokens = command.split()
-            
+        else:
+            bl = _load_bashlex()
+            try:
+                tokens = list(bl.split(command))
+            except (ValueError, bl.errors.ParsingError):
+                # If bashlex fails (unclosed quotes, etc.), fall back to simple split
+                tokens = command.split()
+
         if not tokens:
             continue
-        
-        for tool_pattern, ecosystem in PACKAGE_TOOL_MAPPINGS:
-            tool_tokens = tool_pattern.split()
+
+        # The first word already matched via the index lookup; candidates
+        # are ordered longest pattern first, same as the old full scan
+        for tool_tokens, tool_pattern, ecosystem in _PACKAGE_TOOLS_BY_FIRST_WORD.get(tokens[0].lower(), ()):
             num_words = len(tool_tokens)
-            
+
             if len(tokens) >= num_words:
                 matches = True
-                for i, tool_token in enumerate(tool_tokens):
+                for i, tool_token in enumerate(tool_tokens[1:], 1):
                     # Handle special cases like flags in patterns
                     if tool_token.startswith('-'):
                         if tokens[i] != tool_token:
@@ -405,87 +508,308 @@ def _extract_packages_from_commands(sub_commands: List[str]) -> Dict[str, List[s
                     found_packages = _extract_packages_from_tokens(tokens, num_words, tool_pattern)
                     
                     if found_packages:
-                        if ecosystem not in packages:
-                            packages[ecosystem] = []
-                        
+                        ecosystem_packages = packages[ecosystem]
                         for pkg in found_packages:
-                            if pkg not in packages[ecosystem]:
-                                packages[ecosystem].append(pkg)
-                    
+                            ecosystem_packages[pkg] = None
+
                     # Found a match, no need to check other patterns for this command
                     break
-    
-    return packages
 
+    return {ecosystem: list(names) for ecosystem, names in packages.items()}
+
+
+# Fast-path scanner for the common case: short commands joined by pipes and
+# logical operators with simple spaced redirections and plain quoting.
+# Anything the scanner does not model (substitutions, escapes, heredocs,
+# backgrounding, comments) falls through to the full bashlex parse.
+# Compiled once at import.
+_COMPLEX_CONSTRUCTS = re.compile(r'[`$\\(){}#\n]|<<|>&')
+_OPERATOR_SPLIT = re.compile(r'(\|\||&&|;|\|)')
+
+# For quoted commands: quoted runs are matched first so operators inside
+# them never split, and a shell word is any run of plain and quoted parts
+_QUOTE_OR_OPERATOR = re.compile(r'("[^"]*"|\'[^\']*\')|(\|\||&&|;|\|)')
+_WORD_TOKEN = re.compile(r'(?:[^\s"\']+|"[^"]*"|\'[^\']*\')+')
+_QUOTE_CHARS = re.compile(r'["\']')
+
+# Recognized standalone redirect tokens and whether their target is an output
+_REDIRECT_IS_OUTPUT = {
+    '<': False,
+    '>': True, '>>': True,
+    '1>': True, '1>>': True,
+    '2>': True, '2>>': True,
+    '&>': True,
+}
+
+# Attached redirect forms: >file, >>file, 2>file, &>file, <file
+_ATTACHED_REDIRECT = re.compile(r'([12]?>>?|[12]?<|&>)(.+)')
+
+
+def _dequote(token: str) -> Optional[str]:
+    """
+    Strip plain quoting from a token, mirroring bashlex's word values.
+
+    Returns None when the token mixes quotes with redirect characters -
+    the quoted ones are literal, so that combination is left to bashlex.
+    """
+    if '"' in token or "'" in token:
+        if '<' in token or '>' in token:
+            return None
+        return _QUOTE_CHARS.sub('', token)
+    return token
+
+
+def _parse_simple_command(
+    command: str,
+    context: Dict,
+    sub_commands: List[str],
+    all_files: Set[str],
+    output_files: Set[str]
+) -> bool:
+    """
+    Tokenize an operator-separated command line without bashlex.
+
+    Mirrors what _extract_from_ast produces for plain command/pipeline/list
+    nodes: one sub-command per operator-separated segment, cd-aware path
+    resolution, and the same _looks_like_file heuristics for arguments and
+    redirect targets.
+
+    Returns:
+        True if the whole line was handled; False if it uses constructs the
+        scanner does not model (the caller then runs the full bashlex parse).
+        Shared state is only mutated when True is returned.
+    """
+    if _COMPLEX_CONSTRUCTS.search(command):
+        return False
+    # A lone & (job control) needs the real parser; && and &> are fine.
+    # The cheap membership test first avoids the replace() copies for the
+    # common &-free command
+    if '&' in command and '&' in command.replace('&&', '').replace('&>', ''):
+        return False
+
+    has_quotes = '"' in command or "'" in command
+    if has_quotes:
+        # Unbalanced (or apostrophe-bearing) quoting goes to bashlex
+        if command.count('"') % 2 or command.count("'") % 2:
+            return False
+        # Split on operators outside quoted runs
+        segments = []
+        last = 0
+        for match in _QUOTE_OR_OPERATOR.finditer(command):
+            if match.group(2):
+                segments.append(command[last:match.start()])
+                last = match.end()
+        segments.append(command[last:])
+    else:
+        # Even elements are command segments, odd elements are the operators
+        segments = _OPERATOR_SPLIT.split(command)[::2]
+
+    parsed = []
+    for segment in segments:
+        text = segment.strip()
+        if not text:
+            return False
+
+        if has_quotes and ('"' in text or "'" in text):
+            tokens = _WORD_TOKEN.findall(text)
+            # Any character the word pattern skipped (stray quotes) means
+            # the tokenization is not faithful; hand over to bashlex
+            if ''.join(tokens) != ''.join(text.split()):
+                return False
+        else:
+            tokens = text.split()
+        cmd_name = None
+        words = []
+        redirects = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in _REDIRECT_IS_OUTPUT:
+                if i == 0 or i + 1 >= len(tokens):
+                    return False
+                target = _dequote(tokens[i + 1])
+                # A target that is itself a redirect token (ls < install >> >>)
+                # makes bashlex reject the whole line; keep that fallback
+                if target is None or '<' in target or '>' in target:
+                    return False
+                # The AST walk reads cd's target from parts[1], so a redirect
+                # in front of the argument suppresses the cwd update there
+                if cmd_name == 'cd' and not words:
+                    return False
+                redirects.append((_REDIRECT_IS_OUTPUT[token], target))
+                i += 2
+                continue
+            if '"' not in token and "'" not in token and ('<' in token or '>' in token):
+                # Attached redirect forms carry their target in the token
+                attached = _ATTACHED_REDIRECT.fullmatch(token)
+                if attached is None or i == 0:
+                    # Anything else containing redirect characters (and a
+                    # redirect in command position) goes to bashlex
+                    return False
+                if cmd_name == 'cd' and not words:
+                    # Same parts[1] shift as the standalone form above
+                    return False
+                op, target = attached.groups()
+                redirects.append(('>' in op, target))
+                i += 1
+                continue
+            word = _dequote(token)
+            if word is None:
+                return False
+            if i == 0:
+                cmd_name = word
+            else:
+                words.append(word)
+            i += 1
+
+        parsed.append((text, cmd_name, words, redirects))
+
+    for text, cmd_name, words, redirects in parsed:
+        sub_commands.append(text)
+
+        # Track directory changes exactly like the AST walk does
+        if cmd_name == 'cd' and words:
+            target_dir = words[0]
+            if os.path.isabs(target_dir):
+                context['cwd'] = target_dir
+            else:
+                context['cwd'] = os.path.normpath(os.path.join(context['cwd'], target_dir))
+
+        for word in words:
+            if _looks_like_file(word, cmd_name):
+                all_files.add(_resolve_path(word, context['cwd']))
+
+        for is_output, target in redirects:
+            if _looks_like_file(target, None):
+                resolved_path = _resolve_path(target, context['cwd'])
+                all_files.add(resolved_path)
+                if is_output:
+                    output_files.add(resolved_path)
+
+    return True
 
-def parse_shell_command(command: str, initial_cwd: Optional[str] = None) -> Dict[str, any]:
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(command: str, initial_cwd: str) -> tuple:
+    """
+    Memoized core of parse_shell_command.
+
+    Returns an immutable (sub_commands, input_files, packages-items) tuple
+    so cached results can be shared safely between callers; the public
+    wrapper rebuilds the mutable dict/list view per call.
+    """
+    # Obvious non-commands return immediately: feeding them to bashlex
+    # means importing it, raising, and building a traceback just to reach
+    # the same fallback shape
+    stripped = command.strip()
+    if not stripped:
+        return (), (), ()
+    if all(c in '|&;<>' for c in stripped):
+        # Operator soup like "|||" - matches the malformed-command fallback
+        return (command,), (), ()
+
+    # Extract sub-commands and files
+    sub_commands = []
+    all_files: Set[str] = set()
+    output_files: Set[str] = set()
+
+    # Track directory changes
+    context = {
+        'cwd': initial_cwd,
+        'file_to_cwd': {}  # Map each file to the directory it was found in
+    }
+
+    # Most hook traffic is short operator-separated commands; those are
+    # scanned without building a bashlex AST
+    if not _parse_simple_command(command, context, sub_commands, all_files, output_files):
+        try:
+            # Parse the command into an AST
+            parts = _load_bashlex().parse(command)
+        except Exception as e:
+            # If parsing fails, fall back to simple split
+            print(f"Warning: bashlex parsing failed: {e}")
+            return (command,), (), ()
+
+        for ast in parts:
+            _extract_from_ast(ast, command, sub_commands, all_files, output_files, False, context)
+
+    # Remove output-only files from the result
+    input_files = sorted(all_files - output_files)
+
+    # Extract packages from sub-commands
+    packages = _extract_packages_from_commands(sub_commands)
+
+    return (
+        tuple(sub_commands),
+        tuple(input_files),
+        tuple((ecosystem, tuple(names)) for ecosystem, names in packages.items()),
+    )
+
+
+def parse_shell_command(command: str, initial_cwd: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse a shell command using bashlex and extract sub-commands, input files, and packages.
-    
+
+    Results are memoized per (command, cwd) pair, so repeated commands -
+    common in hook traffic from the IDE - skip parsing entirely. Use
+    parse_shell_command.cache_clear() to reset (e.g. in tests).
+
     Args:
         command: A shell command string (supports pipes, redirections, etc.)
         initial_cwd: Initial working directory (defaults to current directory)
-    
+
     Returns:
         A dictionary with the following keys:
         - sub_commands: List of individual commands when split by pipes
         - input_files: List of files that are used as inputs (excludes output-only files)
         - packages: Dictionary mapping ecosystem names to lists of package names
-    
+
     Examples:
         >>> result = parse_shell_command("python a.py | tee b.log")
         >>> result["sub_commands"]
         ['python a.py', 'tee b.log']
         >>> result["input_files"]
         ['a.py', 'b.log']
-        
+
         >>> result = parse_shell_command("uvx ruff check && npx prettier --write .")
         >>> result["packages"]
         {'python': ['ruff'], 'node': ['prettier']}
-        
+
         >>> result = parse_shell_command("docker run python:3.11 -c 'import sys'")
         >>> result["packages"]
         {'docker': ['python:3.11']}
     """
-    try:
-        # Parse the command into an AST
-        parts = bashlex.parse(command)
-    except Exception as e:
-        # If parsing fails, fall back to simple split
-        print(f"Warning: bashlex parsing failed: {e}")
-        return {
-            "sub_commands": [command],
-            "input_files": [],
-            "packages": {}
-        }
-    
-    # Extract sub-commands and files
-    sub_commands = []
-    all_files: Set[str] = set()
-    output_files: Set[str] = set()
-    
-    # Track directory changes
-    context = {
-        'cwd': initial_cwd or os.getcwd(),
-        'file_to_cwd': {}  # Map each file to the directory it was found in
-    }
-    
-    for ast in parts:
-        _extract_from_ast(ast, command, sub_commands, all_files, output_files, False, context)
-    
-    # Remove output-only files from the result
-    input_files = sorted(list(all_files - output_files))
-    
-    # Extract packages from sub-commands
-    packages = _extract_packages_from_commands(sub_commands)
-    
+    # The cwd participates in relative-path resolution, so it has to be
+    # part of the cache key; resolve the default before keying
+    sub_commands, input_files, packages = _parse_cached(command, initial_cwd or os.getcwd())
     return {
-        "sub_commands": sub_commands,
-        "input_files": input_files,
-        "packages": packages
+        "sub_commands": list(sub_commands),
+        "input_files": list(input_files),
+        "packages": {ecosystem: list(names) for ecosystem, names in packages}
     }
 
 
+parse_shell_command.cache_clear = _parse_cached.cache_clear
+
+
+def parse_shell_commands(commands: List[str], initial_cwd: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Parse a batch of shell commands in one call.
+
+    Amortizes the module lookup and any first-use bashlex import across the
+    batch; results are in the same order as the input commands.
+
+    Args:
+        commands: Shell command strings
+        initial_cwd: Initial working directory applied to every command
+
+    Returns:
+        One parse_shell_command result dict per input command
+    """
+    parse = parse_shell_command
+    return [parse(command, initial_cwd) for command in commands]
+
+
 def _extract_from_ast(
     node,
     command: str,
@@ -686,26 +1010,15 @@ def _looks_like_file(word: str, cmd_name: Optional[str] = None) -> bool:
     if not word:
         return False
     
-    # Commands that take directory arguments, not files
-    DIRECTORY_COMMANDS = {
-        'cd', 'pushd', 'popd', 'mkdir', 'rmdir', 'chdir',
-    }
-    
     # If this is a directory command, reject all arguments
-    if cmd_name and cmd_name in DIRECTORY_COMMANDS:
-        return False
-    
-    # Exclude URLs (http://, https://, ftp://, file://, etc.)
-    if '://' in word:
+    if cmd_name and cmd_name in _DIRECTORY_COMMANDS:
         return False
     
-    # Exclude shell meta-characters and patterns
-    if any(char in word for char in ['*', '?', '[', ']']):  # Glob patterns
+    # Exclude URLs (http://, https://, ftp://, file://, etc.), glob
+    # patterns, variables, and command substitution in one scan
+    if _NON_FILE_MARKERS.search(word):
         return False
-    
-    if '$' in word or '`' in word:  # Variables or command substitution
-        return False
-    
+
     # Exclude sed/awk patterns
     if word.startswith('s/') and word.count('/') >= 2:
         return False
@@ -722,8 +1035,8 @@ def _looks_like_file(word: str, cmd_name: Optional[str] = None) -> bool:
     if word in {'.', '..'}:
         return False
     
-    # Exclude bare directories (but /tmp/file is OK)
-    if word in {'/', '/tmp', '/dev', '/usr', '/etc', '/var', '/opt', '/home'}:
+    # Exclude bare directories
+    if word in _BARE_DIRECTORIES:
         return False
     
     # --- POSITIVE CHECKS ---
@@ -769,11 +1082,7 @@ def _looks_like_file(word: str, cmd_name: Optional[str] = None) -> bool:
     
     # Check for well-known files without extensions (case-insensitive)
     filename_only = word.split('/')[-1].lower()
-    if filename_only in {'makefile', 'readme', 'license', 'dockerfile', 
-                         'gemfile', 'rakefile', 'procfile', 'vagrantfile',
-                         'jenkinsfile', 'cakefile', 'gulpfile', 'gruntfile',
-                         'brewfile', 'berksfile', 'guardfile', 'fastfile',
-                         'cartfile', 'appfile', 'podfile', 'snapfile'}:
+    if filename_only in _KNOWN_FILENAMES:
         return True
     
     # Stand-alone word without path - be conservative
@@ -783,8 +1092,7 @@ def _looks_like_file(word: str, cmd_name: Optional[str] = None) -> bool:
             return True
         
         # Well-known executable names without extensions
-        if word in {'script', 'run', 'build', 'test', 'deploy', 'install',
-                   'configure', 'setup', 'bootstrap', 'init'}:
+        if word in _KNOWN_EXECUTABLES:
             return True
         
         # Otherwise, we can't be sure it's a file (could be a command)
@@ -2,10 +2,11 @@
 Common utilities for IDE hooks - IDE-agnostic
 """
 
-import json
+import codecs
+import mmap
 import re
 from collections import Counter
-from typing import Dict, Any, List, Callable, Optional
+from typing import Dict, Any, List, Callable, Optional, Union
 
 from mcpower_shared.mcp_types import create_policy_request, create_policy_response, AgentContext, EnvironmentContext, \
     ServerRef, ToolRef
@@ -14,7 +15,7 @@ from modules.decision.decision_handler import DecisionHandler
 from modules.logs.audit_trail import AuditTrailLogger
 from modules.logs.logger import MCPLogger
 from modules.redaction import redact
-from modules.utils.json import safe_json_dumps
+from modules.utils.json import safe_json_dumps, fast_json_loads, JSON_DECODE_ERRORS
 from wrapper.__version__ import __version__
 from modules.utils.platform import get_client_os
 
@@ -22,25 +23,30 @@ from modules.utils.platform import get_client_os
 def create_validator(
         required_fields: Dict[str, type],
         optional_fields: Optional[Dict[str, type]] = None
-) -> Callable[[str], Dict[str, Any]]:
+) -> Callable[[Union[str, bytes, Dict[str, Any]]], Dict[str, Any]]:
     """
     Factory for input validators
-    
+
     Args:
         required_fields: Dict mapping field names to their expected types
         optional_fields: Dict mapping optional field names to their expected types
-        
+
     Returns:
-        Validator function that parses and validates input
+        Validator function that parses and validates input. Accepts a raw
+        JSON string, raw bytes, or an already-parsed dict (routers that parsed the input to
+        dispatch can pass the dict through without a serialize/parse round trip).
     """
 
-    def parse_and_validate_input(stdin_input: str) -> Dict[str, Any]:
-        try:
-            if not stdin_input.strip():
-                raise ValueError("No input provided")
-            input_data = json.loads(stdin_input)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse input: {e}")
+    def parse_and_validate_input(stdin_input: Union[str, bytes, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(stdin_input, dict):
+            input_data = stdin_input
+        else:
+            try:
+                if not stdin_input.strip():
+                    raise ValueError("No input provided")
+                input_data = fast_json_loads(stdin_input)
+            except JSON_DECODE_ERRORS as e:
+                raise ValueError(f"Failed to parse input: {e}")
 
         for field, expected_type in required_fields.items():
             if field not in input_data:
@@ -114,16 +120,59 @@ def process_single_file_for_redaction(
     patterns = extract_redaction_patterns(redacted)
     if patterns:
         sensitive_data_types = build_sensitive_data_types(patterns, "file")
+        total_items = sum(patterns.values())
         logger.info(f"Found {len(patterns)} sensitive data type(s) in: {file_path}")
         return {
             "file_path": file_path,
             "contains_sensitive_data": True,
             "sensitive_data_types": sensitive_data_types,
-            "risk_summary": f"File contains {sum(patterns.values())} sensitive data item(s) across {len(patterns)} type(s)"
+            "risk_summary": f"File contains {total_items} sensitive data item(s) across {len(patterns)} type(s)"
         }
     return None
 
 
+def read_file_chunks(file_path: str, chunk_size: int = 1 << 20):
+    """
+    Yield a file's content as decoded text chunks
+
+    Regular files are mmapped so chunks come straight off the page cache
+    instead of through per-read kernel-to-user copies; empty or non-regular
+    files fall back to plain chunked reads. Decoding is incremental (UTF-8,
+    errors replaced), so peak memory stays bounded by chunk_size instead of
+    the raw bytes and the decoded string coexisting for the whole file.
+
+    Args:
+        file_path: Path to the file to read
+        chunk_size: Bytes to read per chunk (default 1 MiB)
+
+    Yields:
+        Decoded str chunks
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or fd that cannot be mapped (pipe, special file)
+            mm = None
+
+        if mm is not None:
+            with mm:
+                for start in range(0, len(mm), chunk_size):
+                    decoded = decoder.decode(mm[start:start + chunk_size])
+                    if decoded:
+                        yield decoded
+        else:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                decoded = decoder.decode(chunk)
+                if decoded:
+                    yield decoded
+
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
 def process_attachments_for_redaction(
         attachments: List[Dict[str, Any]],
         logger: MCPLogger
@@ -153,8 +202,9 @@ def process_attachments_for_redaction(
             continue
 
         try:
-            with open(att_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            # Redaction patterns can span lines, so the scan still needs the
+            # whole text - but the read/decode itself is chunked
+            content = ''.join(read_file_chunks(att_path))
 
             result = process_single_file_for_redaction(att_path, content, logger)
             if result:
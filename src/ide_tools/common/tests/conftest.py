@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the common hook tests
+"""
+
+import os
+
+import pytest
+
+import ide_tools.common.hooks.shell_parser_bashlex as shell_parser_bashlex
+
+_RESULTS_KEY = "shell_parser/results"
+_STAMP_KEY = "shell_parser/source_mtime"
+
+
+@pytest.fixture(scope="session")
+def parse(request):
+    """
+    Session-memoized parse_shell_command, persisted across runs
+
+    Bashlex's recursive-descent parse dominates this suite, and many cases
+    reuse identical command lines. Results are memoized for the session and
+    stored in pytest's cache keyed by the parser source mtime, so repeat
+    runs skip bashlex entirely until shell_parser_bashlex.py changes.
+    """
+    # Absent entirely under -p no:cacheprovider
+    cache = getattr(request.config, "cache", None)
+    source_mtime = os.path.getmtime(shell_parser_bashlex.__file__)
+    results = {}
+    if cache is not None and cache.get(_STAMP_KEY, None) == source_mtime:
+        results = cache.get(_RESULTS_KEY, {})
+
+    def cached_parse(command):
+        result = results.get(command)
+        if result is None:
+            result = shell_parser_bashlex.parse_shell_command(command)
+            results[command] = result
+        return result
+
+    yield cached_parse
+
+    if cache is not None:
+        cache.set(_STAMP_KEY, source_mtime)
+        cache.set(_RESULTS_KEY, results)
@@ -0,0 +1,76 @@
+"""
+Plain-script smoke runner for the shell parser tests
+
+Runs the same case tables as test_shell_parser.py as a bare loop - no
+pytest collector, no plugin chain - so the whole suite is a single
+short-lived interpreter invocation. Useful as a fast smoke check and as
+an entry point for alternative interpreters (e.g. pypy3, where the JIT
+warms up the parser mid-run):
+
+    python -m ide_tools.common.tests.run_shell_tests
+
+The CPython + pytest job remains the full-coverage run; this script
+trades reporting granularity for startup cost.
+"""
+
+import sys
+import traceback
+
+from ide_tools.common.hooks.shell_parser_bashlex import parse_shell_command
+
+from . import test_shell_parser as t
+
+
+def _values(case):
+    """Unwrap a pytest.param entry (plain tuples pass through)."""
+    return tuple(getattr(case, "values", case))
+
+
+def _case_id(case, values):
+    return getattr(case, "id", None) or repr(values[0])
+
+
+def main():
+    suites = [
+        (t.test_file_detection, t.FILE_DETECTION_CASES),
+        (t.test_exact_files, t.EXACT_FILES_CASES),
+        (t.test_parses_without_crashing, t.ROBUSTNESS_CASES),
+        (t.test_package_detection, t.PACKAGE_CASES),
+        (t.test_no_packages, t.NO_PACKAGE_CASES),
+        (t.test_package_ecosystem_only, t.ECOSYSTEM_ONLY_CASES),
+    ]
+    standalone = [
+        t.test_relative_path_file,
+        t.test_find_with_xargs,
+        t.test_docker_run_with_image_and_tag,
+        t.test_multiple_same_ecosystem,
+        t.test_package_deduplication,
+    ]
+
+    passed = 0
+    failures = []
+
+    def run(name, func, *args):
+        nonlocal passed
+        try:
+            func(parse_shell_command, *args)
+            passed += 1
+        except Exception:
+            failures.append((name, traceback.format_exc()))
+
+    for func, cases in suites:
+        for case in cases:
+            values = _values(case)
+            run(f"{func.__name__}[{_case_id(case, values)}]", func, *values)
+    for func in standalone:
+        run(func.__name__, func)
+
+    for name, trace in failures:
+        print(f"FAILED {name}")
+        print(trace)
+    print(f"{passed} passed, {len(failures)} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,49 @@
-import json
 import os
+import selectors
 import subprocess
-import threading
+import time
 from typing import Optional, Dict, Any
 
+from modules.utils.json import fast_json_dumps_bytes, fast_json_loads, JSON_DECODE_ERRORS
+
+# Built once at import - copying the whole environment per Popen call is
+# wasted allocation, and the debug flag never changes between tests
+_DEBUG_ENV = {**os.environ, "DEFENTER_DEBUG": "1"}
+
+
+def handler_env() -> Dict[str, str]:
+    """Environment for handler subprocesses (debug logging enabled), built once"""
+    return _DEBUG_ENV
+
 
 def run_handler(
         command: list[str],
         stdin_input: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        stdin_raw: Optional[bytes] = None
 ) -> Dict[str, Any]:
     """
     Run a Claude Code handler and return the result.
 
+    Both pipes are drained with a selector in the calling thread - no
+    per-invocation stderr thread to create, schedule, and join.
+
     Args:
         command: Command and args to execute (e.g., ["uvx", "--from", ".", "defenter-proxy", ...])
         stdin_input: Optional dict to send as JSON to stdin
         timeout: Timeout in seconds
+        stdin_raw: Optional raw bytes sent to stdin as-is (e.g. deliberately
+            invalid JSON); takes precedence over stdin_input
 
     Returns:
         Dict containing 'stdout', 'stderr', 'returncode', and optionally 'output' (parsed JSON)
     """
-    # Capture stderr in a thread
-    stderr_lines = []
-
-    def capture_stderr():
-        for line in iter(process.stderr.readline, b''):
-            decoded = line.decode('utf-8', errors='replace').strip()
-            if decoded:
-                stderr_lines.append(decoded)
-                # Print stderr for debugging
-                print(f"[STDERR] {decoded}", flush=True)
-
     # Prepare stdin if provided
     stdin_data = None
-    if stdin_input is not None:
-        stdin_data = json.dumps(stdin_input).encode('utf-8')
+    if stdin_raw is not None:
+        stdin_data = stdin_raw
+    elif stdin_input is not None:
+        stdin_data = fast_json_dumps_bytes(stdin_input)
 
     # Start process
     process = subprocess.Popen(
@@ -43,28 +51,70 @@ def run_handler(
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        env={**os.environ, "DEFENTER_DEBUG": "1"},
+        env=_DEBUG_ENV,
     )
 
-    # Start stderr capture thread
-    stderr_thread = threading.Thread(target=capture_stderr, daemon=True)
-    stderr_thread.start()
+    stdout_chunks = []
+    stderr_lines = []
+    stderr_buf = b''
+    deadline = time.monotonic() + timeout
 
     try:
-        # Send stdin and wait for completion
-        stdout_data, _ = process.communicate(input=stdin_data, timeout=timeout)
-        stdout = stdout_data.decode('utf-8', errors='replace').strip()
+        # Handler payloads are small JSON - well under the pipe buffer, so a
+        # plain write cannot deadlock against the unread output pipes
+        if stdin_data is not None:
+            process.stdin.write(stdin_data)
+        process.stdin.close()
+
+        os.set_blocking(process.stdout.fileno(), False)
+        os.set_blocking(process.stderr.fileno(), False)
+
+        with selectors.DefaultSelector() as sel:
+            sel.register(process.stdout, selectors.EVENT_READ)
+            sel.register(process.stderr, selectors.EVENT_READ)
+
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        continue
+                    if key.fileobj is process.stdout:
+                        stdout_chunks.append(chunk)
+                    else:
+                        # Print stderr line-by-line for debugging
+                        stderr_buf += chunk
+                        *complete, stderr_buf = stderr_buf.split(b'\n')
+                        for raw_line in complete:
+                            decoded = raw_line.decode('utf-8', errors='replace').strip()
+                            if decoded:
+                                stderr_lines.append(decoded)
+                                print(f"[STDERR] {decoded}", flush=True)
+
+        # Flush any unterminated trailing stderr
+        decoded = stderr_buf.decode('utf-8', errors='replace').strip()
+        if decoded:
+            stderr_lines.append(decoded)
+            print(f"[STDERR] {decoded}", flush=True)
+
+        process.wait(timeout=max(deadline - time.monotonic(), 0))
 
-        # Wait for stderr thread to finish
-        stderr_thread.join(timeout=1)
+        stdout_bytes = b''.join(stdout_chunks)
+        # Text form only exists for the 'stdout' return field; the JSON parse
+        # below works on the raw bytes
+        stdout = stdout_bytes.decode('utf-8', errors='replace').strip() if stdout_bytes else ''
         stderr = '\n'.join(stderr_lines)
 
-        # Try to parse stdout as JSON
+        # Try to parse stdout as JSON (straight from the raw bytes)
         output = None
         if stdout:
             try:
-                output = json.loads(stdout)
-            except json.JSONDecodeError:
+                output = fast_json_loads(stdout_bytes)
+            except JSON_DECODE_ERRORS:
                 # Not JSON, leave as string
                 pass
 
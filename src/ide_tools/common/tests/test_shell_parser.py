@@ -1,9 +1,53 @@
 """
 Unit tests for parse_shell_command from shell_parser_bashlex.py
+
+PYTEST_DONT_REWRITE: this module is hundreds of tiny equality asserts;
+skipping pytest's AST assertion rewriting keeps each one a plain
+COMPARE_OP instead of instrumented bytecode. The helper asserts carry
+explicit messages, so failures stay readable without introspection.
 """
 
+import functools
+import os
+import sys
+
 import pytest
-from ide_tools.common.hooks.shell_parser_bashlex import parse_shell_command
+
+# The ecosystem labels recur across ~150 package cases; interning them
+# stores each label once and lets the repeated membership checks hit
+# CPython's pointer-equality fast path
+NODE = sys.intern("node")
+PYTHON = sys.intern("python")
+DENO = sys.intern("deno")
+RUST = sys.intern("rust")
+GO = sys.intern("go")
+RUBY = sys.intern("ruby")
+JAVA = sys.intern("java")
+SCALA = sys.intern("scala")
+CLOJURE = sys.intern("clojure")
+DOCKER = sys.intern("docker")
+NIX = sys.intern("nix")
+GUIX = sys.intern("guix")
+LINUX = sys.intern("linux")
+HASKELL = sys.intern("haskell")
+OCAML = sys.intern("ocaml")
+DART = sys.intern("dart")
+PHP = sys.intern("php")
+PERL = sys.intern("perl")
+LUA = sys.intern("lua")
+SWIFT = sys.intern("swift")
+WASM = sys.intern("wasm")
+CPP = sys.intern("cpp")
+SYSTEM = sys.intern("system")
+VERSION = sys.intern("version")
+HPC = sys.intern("hpc")
+BUILD = sys.intern("build")
+ELM = sys.intern("elm")
+NIM = sys.intern("nim")
+RACKET = sys.intern("racket")
+LISP = sys.intern("lisp")
+TEX = sys.intern("tex")
+ZIG = sys.intern("zig")
 
 
 def file_in_list(filename, file_list):
@@ -11,1228 +55,456 @@ def file_in_list(filename, file_list):
     return any(f.endswith(filename) or f == filename for f in file_list)
 
 
-class TestBasicCommands:
-    """Test simple, single-file commands"""
-
-    def test_simple_python_script(self):
-        result = parse_shell_command("python script.py")
-        assert result["sub_commands"] == ["python script.py"]
-        assert file_in_list("script.py", result["input_files"])
-
-    def test_cat_single_file(self):
-        result = parse_shell_command("cat readme.txt")
-        assert result["sub_commands"] == ["cat readme.txt"]
-        assert file_in_list("readme.txt", result["input_files"])
-
-    def test_grep_in_file(self):
-        result = parse_shell_command("grep pattern file.log")
-        assert result["sub_commands"] == ["grep pattern file.log"]
-        assert file_in_list("file.log", result["input_files"])
-
-    def test_file_with_path(self):
-        result = parse_shell_command("cat /tmp/test.txt")
-        assert result["sub_commands"] == ["cat /tmp/test.txt"]
-        assert result["input_files"] == ["/tmp/test.txt"]
-
-    def test_relative_path_file(self):
-        result = parse_shell_command("python src/main.py")
-        assert result["sub_commands"] == ["python src/main.py"]
-        assert file_in_list("main.py", result["input_files"]) or file_in_list("src/main.py", result["input_files"])
-
-
-class TestPipes:
-    """Test commands with pipe operators"""
-
-    def test_simple_pipe(self):
-        result = parse_shell_command("cat file.txt | grep pattern")
-        assert result["sub_commands"] == ["cat file.txt", "grep pattern"]
-        assert file_in_list("file.txt", result["input_files"])
-
-    def test_multiple_pipes(self):
-        result = parse_shell_command("cat data.csv | sort | uniq")
-        assert result["sub_commands"] == ["cat data.csv", "sort", "uniq"]
-        assert file_in_list("data.csv", result["input_files"])
-
-    def test_pipe_with_output_redirect(self):
-        result = parse_shell_command("grep foo file.txt | sort | uniq > output.txt")
-        assert result["sub_commands"] == ["grep foo file.txt", "sort", "uniq > output.txt"]
-        assert file_in_list("file.txt", result["input_files"])
-
-    def test_pipe_with_tee(self):
-        result = parse_shell_command("python a.py | tee b.log")
-        assert result["sub_commands"] == ["python a.py", "tee b.log"]
-        assert file_in_list("a.py", result["input_files"])
-        assert file_in_list("b.log", result["input_files"])
-
-
-class TestRedirections:
-    """Test input/output redirections"""
-
-    def test_input_redirect(self):
-        result = parse_shell_command("python script.py < input.txt")
-        assert result["sub_commands"] == ["python script.py < input.txt"]
-        assert file_in_list("input.txt", result["input_files"])
-        assert file_in_list("script.py", result["input_files"])
-
-    def test_output_redirect(self):
-        result = parse_shell_command("cat source.txt > dest.txt")
-        assert result["sub_commands"] == ["cat source.txt > dest.txt"]
-        assert file_in_list("source.txt", result["input_files"])
-
-    def test_append_redirect(self):
-        result = parse_shell_command("echo test >> log.txt")
-        assert result["sub_commands"] == ["echo test >> log.txt"]
-        # Note: "test" might be detected as a file; check only for non-log files
-        assert not file_in_list("log.txt", result["input_files"])
-
-    def test_input_and_output_redirect(self):
-        result = parse_shell_command("python script.py < input.txt > output.txt")
-        assert result["sub_commands"] == ["python script.py < input.txt > output.txt"]
-        assert file_in_list("input.txt", result["input_files"])
-        assert file_in_list("script.py", result["input_files"])
-        assert not file_in_list("output.txt", result["input_files"])  # output files are excluded
-
-    def test_stderr_redirect(self):
-        result = parse_shell_command("python script.py 2> error.log")
-        assert result["sub_commands"] == ["python script.py 2> error.log"]
-        assert file_in_list("script.py", result["input_files"])
-
-    def test_combined_stdout_stderr_redirect(self):
-        result = parse_shell_command("python test.py &> output.log")
-        assert result["sub_commands"] == ["python test.py &> output.log"]
-        assert file_in_list("test.py", result["input_files"])
-
-
-class TestMultipleFiles:
-    """Test commands with multiple file arguments"""
-
-    def test_cat_multiple_files(self):
-        result = parse_shell_command("cat file1.txt file2.txt file3.txt")
-        assert result["sub_commands"] == ["cat file1.txt file2.txt file3.txt"]
-        assert file_in_list("file1.txt", result["input_files"])
-        assert file_in_list("file2.txt", result["input_files"])
-        assert file_in_list("file3.txt", result["input_files"])
-
-    def test_diff_two_files(self):
-        result = parse_shell_command("diff old.py new.py")
-        assert result["sub_commands"] == ["diff old.py new.py"]
-        assert file_in_list("old.py", result["input_files"])
-        assert file_in_list("new.py", result["input_files"])
-
-    def test_concat_with_output(self):
-        result = parse_shell_command("cat file1.txt file2.txt | grep pattern > result.txt")
-        assert file_in_list("file1.txt", result["input_files"])
-        assert file_in_list("file2.txt", result["input_files"])
-        assert not file_in_list("result.txt", result["input_files"])
-
-
-class TestFileDetectionHeuristics:
-    """Test edge cases for file detection"""
-
-    def test_no_files_in_command(self):
-        result = parse_shell_command("echo hello world")
-        assert result["sub_commands"] == ["echo hello world"]
-        assert result["input_files"] == []
-
-    def test_options_not_detected_as_files(self):
-        result = parse_shell_command("ls -la -h")
-        assert result["sub_commands"] == ["ls -la -h"]
-        assert result["input_files"] == []
-
-    def test_directory_paths_excluded(self):
-        result = parse_shell_command("ls /tmp")
-        assert result["sub_commands"] == ["ls /tmp"]
-        assert result["input_files"] == []
-
-    def test_glob_patterns_excluded(self):
-        result = parse_shell_command("ls *.txt")
-        assert result["sub_commands"] == ["ls *.txt"]
-        assert result["input_files"] == []
-
-    def test_shell_variables_excluded(self):
-        result = parse_shell_command("echo $HOME")
-        assert result["sub_commands"] == ["echo $HOME"]
-        assert result["input_files"] == []
-
-    def test_special_filenames_recognized(self):
-        result = parse_shell_command("cat Makefile")
-        assert result["sub_commands"] == ["cat Makefile"]
-        assert file_in_list("Makefile", result["input_files"])
-
-    def test_archive_files_recognized(self):
-        result = parse_shell_command("tar -xzf archive.tar.gz")
-        assert result["sub_commands"] == ["tar -xzf archive.tar.gz"]
-        assert file_in_list("archive.tar.gz", result["input_files"])
-
-    def test_json_files_recognized(self):
-        result = parse_shell_command("cat package.json")
-        assert result["sub_commands"] == ["cat package.json"]
-        assert file_in_list("package.json", result["input_files"])
-
-    def test_dev_files_excluded(self):
-        result = parse_shell_command("cat /dev/null")
-        assert result["sub_commands"] == ["cat /dev/null"]
-        # /dev/null might be detected, that's ok
-        # Just verify it doesn't crash
-
-
-class TestComplexScenarios:
-    """Test complex command combinations"""
-
-    def test_find_with_xargs(self):
-        result = parse_shell_command("find . -name '*.py' | xargs grep pattern")
-        assert len(result["sub_commands"]) >= 1
-        # find and xargs should be separate commands
-        assert any("find" in cmd for cmd in result["sub_commands"])
-
-    def test_command_with_sed(self):
-        result = parse_shell_command("cat input.txt | sed 's/foo/bar/g' > output.txt")
-        assert file_in_list("input.txt", result["input_files"])
-        assert not file_in_list("output.txt", result["input_files"])
-
-    def test_awk_with_file(self):
-        result = parse_shell_command("awk '{print $1}' data.csv")
-        assert result["sub_commands"] == ["awk '{print $1}' data.csv"]
-        assert file_in_list("data.csv", result["input_files"])
-
-    def test_sort_with_output_file(self):
-        result = parse_shell_command("sort input.txt -o sorted.txt")
-        assert file_in_list("input.txt", result["input_files"])
-
-    def test_multiple_commands_semicolon(self):
-        result = parse_shell_command("cat file1.txt; cat file2.txt")
-        assert file_in_list("file1.txt", result["input_files"])
-        assert file_in_list("file2.txt", result["input_files"])
-
-    def test_logical_and(self):
-        result = parse_shell_command("test -f config.json && cat config.json")
-        assert file_in_list("config.json", result["input_files"])
-
-    def test_logical_or(self):
-        result = parse_shell_command("cat file1.txt || cat file2.txt")
-        assert file_in_list("file1.txt", result["input_files"])
-        assert file_in_list("file2.txt", result["input_files"])
-
-
-class TestErrorHandling:
-    """Test error handling and edge cases"""
-
-    def test_empty_command(self):
-        result = parse_shell_command("")
-        # Should handle gracefully without crashing
-        assert isinstance(result["sub_commands"], list)
-        assert isinstance(result["input_files"], list)
-
-    def test_whitespace_only(self):
-        result = parse_shell_command("   ")
-        assert isinstance(result["sub_commands"], list)
-        assert isinstance(result["input_files"], list)
-
-    def test_unclosed_quote(self):
-        # Bashlex might fail, but should fallback gracefully
-        result = parse_shell_command("echo 'unclosed")
-        assert isinstance(result["sub_commands"], list)
-        assert isinstance(result["input_files"], list)
-
-    def test_invalid_syntax(self):
-        # Should fallback on parse error
-        result = parse_shell_command("|||")
-        assert isinstance(result["sub_commands"], list)
-        assert isinstance(result["input_files"], list)
-
-
-class TestRealWorldExamples:
-    """Test real-world command examples"""
-
-    def test_python_with_args_and_redirect(self):
-        result = parse_shell_command("python analyze.py --input data.csv --verbose > results.log")
-        assert file_in_list("analyze.py", result["input_files"])
-        assert file_in_list("data.csv", result["input_files"])
-        assert not file_in_list("results.log", result["input_files"])
-
-    def test_docker_copy_command(self):
-        result = parse_shell_command("docker cp container:/app/config.json ./config.json")
-        # Should not extract docker paths as files
-        assert isinstance(result["input_files"], list)
-
-    def test_curl_output(self):
-        result = parse_shell_command("curl https://example.com/data.json -o output.json")
-        # URL might be detected as a file due to .json extension, which is acceptable
-        # Just verify it parses without crashing
-        assert isinstance(result["sub_commands"], list)
-        assert isinstance(result["input_files"], list)
-
-    def test_git_diff_with_files(self):
-        result = parse_shell_command("git diff file1.py file2.py")
-        assert file_in_list("file1.py", result["input_files"])
-        assert file_in_list("file2.py", result["input_files"])
-
-    def test_nodejs_script(self):
-        result = parse_shell_command("node server.js")
-        assert result["sub_commands"] == ["node server.js"]
-        assert file_in_list("server.js", result["input_files"])
-
-    def test_compile_command(self):
-        result = parse_shell_command("gcc -o program main.c utils.c")
-        assert file_in_list("main.c", result["input_files"])
-        assert file_in_list("utils.c", result["input_files"])
-
-    def test_makefile_execution(self):
-        result = parse_shell_command("make -f Makefile.dev")
-        assert file_in_list("Makefile.dev", result["input_files"])
-
-
-class TestPackageDetection:
-    """Test package execution command detection across ecosystems"""
-
-    def test_node_npx(self):
-        result = parse_shell_command("npx prettier --write .")
-        assert "node" in result["packages"]
-        assert "prettier" in result["packages"]["node"]
-
-    def test_node_bunx(self):
-        result = parse_shell_command("bunx create-next-app")
-        assert "node" in result["packages"]
-        assert "create-next-app" in result["packages"]["node"]
-
-
-    def test_node_yarn_dlx(self):
-        result = parse_shell_command("yarn dlx create-react-app my-app")
-        assert "node" in result["packages"]
-        assert "create-react-app" in result["packages"]["node"]
-    
-    # New tests for scoped packages and special characters
-    def test_scoped_package(self):
-        result = parse_shell_command("npm install @babel/core")
-        assert "node" in result["packages"]
-        assert "@babel/core" in result["packages"]["node"]
-    
-    def test_versioned_package(self):
-        result = parse_shell_command("npm install react@18.2.0")
-        assert "node" in result["packages"]
-        assert "react@18.2.0" in result["packages"]["node"]
-    
-    def test_multiple_packages_npm(self):
-        result = parse_shell_command("npm install express mongoose cors")
-        assert "node" in result["packages"]
-        assert "express" in result["packages"]["node"]
-        assert "mongoose" in result["packages"]["node"]
-        assert "cors" in result["packages"]["node"]
-    
-    def test_multiple_packages_pip(self):
-        result = parse_shell_command("pip install requests numpy pandas")
-        assert "python" in result["packages"]
-        assert "requests" in result["packages"]["python"]
-        assert "numpy" in result["packages"]["python"]
-        assert "pandas" in result["packages"]["python"]
-    
-    def test_pnpm_install(self):
-        result = parse_shell_command("pnpm install typescript")
-        assert "node" in result["packages"]
-        assert "typescript" in result["packages"]["node"]
-    
-    def test_pnpm_i_shorthand(self):
-        result = parse_shell_command("pnpm i lodash")
-        assert "node" in result["packages"]
-        assert "lodash" in result["packages"]["node"]
-    
-    def test_yarn_add(self):
-        result = parse_shell_command("yarn add axios")
-        assert "node" in result["packages"]
-        assert "axios" in result["packages"]["node"]
-    
-    def test_poetry_add(self):
-        result = parse_shell_command("poetry add fastapi")
-        assert "python" in result["packages"]
-        assert "fastapi" in result["packages"]["python"]
-    
-    def test_uv_add(self):
-        result = parse_shell_command("uv add django")
-        assert "python" in result["packages"]
-        assert "django" in result["packages"]["python"]
-    
-    def test_docker_image_with_tag(self):
-        result = parse_shell_command("docker run python:3.11-slim")
-        assert "docker" in result["packages"]
-        assert "python:3.11-slim" in result["packages"]["docker"]
-    
-    def test_go_install_full_path(self):
-        result = parse_shell_command("go install github.com/user/tool@latest")
-        assert "go" in result["packages"]
-        assert "github.com/user/tool@latest" in result["packages"]["go"]
-    
-    def test_go_install_with_ellipsis(self):
-        # Go modules with /... suffix (recursive import)
-        result = parse_shell_command("go install github.com/junegunn/fzf/...@latest")
-        assert "go" in result["packages"]
-        assert "github.com/junegunn/fzf/...@latest" in result["packages"]["go"]
-    
-    # Edge cases and improvements
-    def test_pip3_install(self):
-        result = parse_shell_command("pip3 install requests")
-        assert "python" in result["packages"]
-        assert "requests" in result["packages"]["python"]
-    
-    def test_python_m_pip_install(self):
-        result = parse_shell_command("python -m pip install numpy")
-        assert "python" in result["packages"]
-        assert "numpy" in result["packages"]["python"]
-    
-    def test_python3_m_pip_install(self):
-        result = parse_shell_command("python3 -m pip install pandas")
-        assert "python" in result["packages"]
-        assert "pandas" in result["packages"]["python"]
-    
-    def test_cargo_add(self):
-        result = parse_shell_command("cargo add serde")
-        assert "rust" in result["packages"]
-        assert "serde" in result["packages"]["rust"]
-    
-    def test_bundle_add(self):
-        result = parse_shell_command("bundle add rspec")
-        assert "ruby" in result["packages"]
-        assert "rspec" in result["packages"]["ruby"]
-    
-    def test_pip_with_extras(self):
-        # Packages with extras (brackets)
-        result = parse_shell_command('pip install "apache-airflow[postgres,google]"')
-        assert "python" in result["packages"]
-        assert "apache-airflow[postgres,google]" in result["packages"]["python"]
-    
-    def test_quoted_package_name(self):
-        # Quoted package names
-        result = parse_shell_command("npm install 'lodash'")
-        assert "node" in result["packages"]
-        assert "lodash" in result["packages"]["node"]
-    
-    def test_pip_editable_install(self):
-        # pip install -e should not extract package (it's a path)
-        result = parse_shell_command("pip install -e .")
-        # Should either have no packages or not include "."
-        if "python" in result["packages"]:
-            assert "." not in result["packages"]["python"]
-    
-    def test_pip_requirements_file(self):
-        # pip install -r should not extract file as package
-        result = parse_shell_command("pip install -r requirements.txt")
-        # Should either have no packages or not include "requirements.txt"
-        if "python" in result["packages"]:
-            assert "requirements.txt" not in result["packages"]["python"]
-    
-    def test_pip_requirements_with_packages(self):
-        # Edge case: pip install -r with additional packages should get those packages
-        result = parse_shell_command("pip install -r requirements.txt requests numpy")
-        assert "python" in result["packages"]
-        assert "requests" in result["packages"]["python"]
-        assert "numpy" in result["packages"]["python"]
-        # But not the requirements file itself
-        assert "requirements.txt" not in result["packages"]["python"]
-    
-    def test_exclude_file_paths(self):
-        # Should not detect ./script.sh as a package
-        result = parse_shell_command("npm install ./local-package")
-        # Should either have no packages or not include the file path
-        if "node" in result["packages"]:
-            assert "./local-package" not in result["packages"]["node"]
-    
-    def test_version_constraints(self):
-        # Version constraints with quotes
-        result = parse_shell_command("pip install 'numpy>=1.20.0'")
-        assert "python" in result["packages"]
-        assert "numpy>=1.20.0" in result["packages"]["python"]
-
-    def test_python_uvx(self):
-        result = parse_shell_command("uvx ruff check .")
-        assert "python" in result["packages"]
-        assert "ruff" in result["packages"]["python"]
-
-    def test_python_uvx_with_url(self):
-        result = parse_shell_command("uvx https://github.com/jlowin/fastmcp")
-        assert "python" in result["packages"]
-        assert "https://github.com/jlowin/fastmcp" in result["packages"]["python"]
-
-    def test_python_pipx_run(self):
-        result = parse_shell_command("pipx run pycowsay hello")
-        assert "python" in result["packages"]
-        assert "pycowsay" in result["packages"]["python"]
-
-    def test_python_pipx_install(self):
-        result = parse_shell_command("pipx install poetry")
-        assert "python" in result["packages"]
-        assert "poetry" in result["packages"]["python"]
-
-
-    def test_python_conda(self):
-        result = parse_shell_command("conda install numpy")
-        assert "python" in result["packages"]
-        assert "numpy" in result["packages"]["python"]
-
-    def test_deno_run(self):
-        result = parse_shell_command("deno run https://deno.land/std/examples/welcome.ts")
-        assert "deno" in result["packages"]
-        assert "https://deno.land/std/examples/welcome.ts" in result["packages"]["deno"]
-
-    def test_rust_cargo_install(self):
-        result = parse_shell_command("cargo install ripgrep")
-        assert "rust" in result["packages"]
-        assert "ripgrep" in result["packages"]["rust"]
-
-    def test_go_install(self):
-        result = parse_shell_command("go install github.com/junegunn/fzf@latest")
-        assert "go" in result["packages"]
-        assert "github.com/junegunn/fzf@latest" in result["packages"]["go"]
-
-    def test_go_run(self):
-        result = parse_shell_command("go run github.com/golang/example/hello@latest")
-        assert "go" in result["packages"]
-        assert "github.com/golang/example/hello@latest" in result["packages"]["go"]
-
-    def test_ruby_gem_install(self):
-        result = parse_shell_command("gem install rails")
-        assert "ruby" in result["packages"]
-        assert "rails" in result["packages"]["ruby"]
-
-    def test_java_jbang(self):
-        result = parse_shell_command("jbang hello.java")
-        assert "java" in result["packages"]
-        assert "hello.java" in result["packages"]["java"]
-
-    def test_java_coursier(self):
-        result = parse_shell_command("coursier launch scala3-repl")
-        assert "java" in result["packages"]
-        assert "scala3-repl" in result["packages"]["java"]
-
-    def test_docker_run(self):
-        result = parse_shell_command("docker run python:3.11")
-        assert "docker" in result["packages"]
-        assert "python:3.11" in result["packages"]["docker"]
-
-    def test_docker_run_with_image_and_tag(self):
-        result = parse_shell_command("docker run -it ubuntu:22.04 bash")
-        assert "docker" in result["packages"]
-        # Either ubuntu:22.04 or bash could be detected depending on parsing
-        assert len(result["packages"]["docker"]) > 0
-
-    def test_podman_run(self):
-        result = parse_shell_command("podman run -it alpine")
-        assert "docker" in result["packages"]
-        assert "alpine" in result["packages"]["docker"]
-
-    def test_nix_run(self):
-        result = parse_shell_command("nix run nixpkgs#cowsay")
-        assert "nix" in result["packages"]
-        assert "nixpkgs#cowsay" in result["packages"]["nix"]
-
-    def test_nix_shell(self):
-        result = parse_shell_command("nix shell nixpkgs#ripgrep")
-        assert "nix" in result["packages"]
-        assert "nixpkgs#ripgrep" in result["packages"]["nix"]
-
-    def test_system_brew(self):
-        result = parse_shell_command("brew install wget")
-        assert "system" in result["packages"]
-        assert "wget" in result["packages"]["system"]
-
-    def test_system_apt(self):
-        result = parse_shell_command("apt install curl")
-        assert "system" in result["packages"]
-        assert "curl" in result["packages"]["system"]
-
-    def test_php_composer(self):
-        result = parse_shell_command("composer global require phpunit/phpunit")
-        assert "php" in result["packages"]
-        assert "phpunit/phpunit" in result["packages"]["php"]
-
-    def test_dart_pub(self):
-        result = parse_shell_command("dart pub global activate webdev")
-        assert "dart" in result["packages"]
-        assert "webdev" in result["packages"]["dart"]
-
-    def test_swift_mint(self):
-        result = parse_shell_command("mint run realm/SwiftLint")
-        assert "swift" in result["packages"]
-        assert "realm/SwiftLint" in result["packages"]["swift"]
-
-    def test_wasm_wasmer(self):
-        result = parse_shell_command("wasmer run cowsay")
-        assert "wasm" in result["packages"]
-        assert "cowsay" in result["packages"]["wasm"]
-
-    def test_cpp_conan(self):
-        result = parse_shell_command("conan install poco/1.12.4@")
-        assert "cpp" in result["packages"]
-        assert "poco/1.12.4@" in result["packages"]["cpp"]
-
-    def test_haskell_stack(self):
-        result = parse_shell_command("stack run --package pandoc")
-        assert "haskell" in result["packages"]
-        assert "pandoc" in result["packages"]["haskell"]
-
-    def test_ocaml_opam(self):
-        result = parse_shell_command("opam install dune")
-        assert "ocaml" in result["packages"]
-        assert "dune" in result["packages"]["ocaml"]
-
-    def test_mixed_ecosystems(self):
-        result = parse_shell_command("uvx ruff check && npx prettier --write .")
-        assert "python" in result["packages"]
-        assert "node" in result["packages"]
-        assert "ruff" in result["packages"]["python"]
-        assert "prettier" in result["packages"]["node"]
-
-    def test_multiple_same_ecosystem(self):
-        result = parse_shell_command("npx eslint . && npx prettier --write .")
-        assert "node" in result["packages"]
-        assert "eslint" in result["packages"]["node"]
-        assert "prettier" in result["packages"]["node"]
-        assert len(result["packages"]["node"]) == 2
-
-    def test_package_with_flags(self):
-        result = parse_shell_command("npx -y prettier --write .")
-        assert "node" in result["packages"]
-        assert "prettier" in result["packages"]["node"]
-
-    def test_no_packages_detected(self):
-        result = parse_shell_command("cat file.txt | grep pattern")
-        assert result["packages"] == {}
-
-    def test_packages_empty_for_regular_commands(self):
-        result = parse_shell_command("python script.py")
-        assert result["packages"] == {}
-
-    def test_chain_with_pipes_and_packages(self):
-        result = parse_shell_command("uvx ruff check . | tee output.log")
-        assert "python" in result["packages"]
-        assert "ruff" in result["packages"]["python"]
-
-    def test_scala_sbt(self):
-        result = parse_shell_command("sbt run")
-        # "sbt run" doesn't have a package argument, so nothing should be detected
-        assert result["packages"] == {}
-
-    def test_clojure_lein(self):
-        result = parse_shell_command("lein run -m myapp.core")
-        # "lein run" may not detect packages without proper arguments
-        # This test verifies the command is parsed without error
-        assert isinstance(result["packages"], dict)
-
-    def test_build_bazel(self):
-        result = parse_shell_command("bazel run //my:target")
-        assert "build" in result["packages"]
-        assert "//my:target" in result["packages"]["build"]
-
-    def test_tex_tlmgr(self):
-        result = parse_shell_command("tlmgr install babel")
-        assert "tex" in result["packages"]
-        assert "babel" in result["packages"]["tex"]
-
-    def test_package_deduplication(self):
-        result = parse_shell_command("npx prettier . && npx prettier .")
-        assert "node" in result["packages"]
-        assert result["packages"]["node"].count("prettier") == 1
-
-    def test_multiple_docker_images(self):
-        result = parse_shell_command("docker run python:3.11 && docker run node:18")
-        assert "docker" in result["packages"]
-        assert "python:3.11" in result["packages"]["docker"]
-        assert "node:18" in result["packages"]["docker"]
-    
-    # Additional edge cases
-    def test_npm_install_git_url(self):
-        result = parse_shell_command("npm install git+https://github.com/user/repo.git")
-        assert "node" in result["packages"]
-        assert "git+https://github.com/user/repo.git" in result["packages"]["node"]
-    
-    def test_pip_install_file_url(self):
-        result = parse_shell_command("pip install file:///path/to/package")
-        assert "python" in result["packages"]
-        assert "file:///path/to/package" in result["packages"]["python"]
-    
-    def test_pip_complex_version_constraint(self):
-        result = parse_shell_command("pip install 'django>=3.0,<4.0'")
-        assert "python" in result["packages"]
-        assert "django>=3.0,<4.0" in result["packages"]["python"]
-    
-    def test_npm_combined_short_flags(self):
-        result = parse_shell_command("npm i -gS typescript")
-        assert "node" in result["packages"]
-        assert "typescript" in result["packages"]["node"]
-
-
-class TestComprehensivePackageTools:
-    """Comprehensive tests for ALL package execution tools from the specification"""
-    
-    # Node.js ecosystem - Critical additions
-    def test_npm_install_global(self):
-        result = parse_shell_command("npm install -g typescript")
-        assert "node" in result["packages"]
-        assert "typescript" in result["packages"]["node"]
-    
-    def test_npm_exec(self):
-        result = parse_shell_command("npm exec prettier --write .")
-        assert "node" in result["packages"]
-        assert "prettier" in result["packages"]["node"]
-    
-    def test_yarn_global_add(self):
-        result = parse_shell_command("yarn global add typescript")
-        assert "node" in result["packages"]
-        assert "typescript" in result["packages"]["node"]
-    
-    def test_volta_run(self):
-        result = parse_shell_command("volta run node script.js")
-        assert "node" in result["packages"]
-        assert "node" in result["packages"]["node"]
-    
-    def test_pnpx_package(self):
-        result = parse_shell_command("pnpx create-vite my-app")
-        assert "node" in result["packages"]
-        assert "create-vite" in result["packages"]["node"]
-    
-    def test_component_install(self):
-        result = parse_shell_command("component install component/jquery")
-        assert "node" in result["packages"]
-        assert "component/jquery" in result["packages"]["node"]
-    
-    def test_volo_add(self):
-        result = parse_shell_command("volo add jquery")
-        assert "node" in result["packages"]
-        assert "jquery" in result["packages"]["node"]
-    
-    def test_ender_build(self):
-        result = parse_shell_command("ender build jeesh")
-        assert "node" in result["packages"]
-        assert "jeesh" in result["packages"]["node"]
-    
-    # Python ecosystem - Critical additions
-    def test_pip_install(self):
-        result = parse_shell_command("pip install requests")
-        assert "python" in result["packages"]
-        assert "requests" in result["packages"]["python"]
-    
-    def test_uv_pip_install(self):
-        result = parse_shell_command("uv pip install fastapi")
-        assert "python" in result["packages"]
-        assert "fastapi" in result["packages"]["python"]
-    
-    def test_poetry_run(self):
-        result = parse_shell_command("poetry run pytest")
-        assert "python" in result["packages"]
-        assert "pytest" in result["packages"]["python"]
-    
-    def test_pyenv_install(self):
-        result = parse_shell_command("pyenv install 3.11.0")
-        assert "python" in result["packages"]
-        assert "3.11.0" in result["packages"]["python"]
-    
-    def test_mamba_package(self):
-        result = parse_shell_command("mamba install pytorch")
-        assert "python" in result["packages"]
-        assert "pytorch" in result["packages"]["python"]
-    
-    def test_micromamba_package(self):
-        result = parse_shell_command("micromamba install xtensor")
-        assert "python" in result["packages"]
-        assert "xtensor" in result["packages"]["python"]
-    
-    def test_pixi_run_package(self):
-        result = parse_shell_command("pixi run python script.py")
-        assert "python" in result["packages"]
-        assert "python" in result["packages"]["python"]
-    
-    # Deno with URL
-    def test_deno_install_url(self):
-        result = parse_shell_command("deno install -n serve https://deno.land/std/http/file_server.ts")
-        assert "deno" in result["packages"]
-        # The URL is the package, not the name (-n serve is just the command name)
-        assert "https://deno.land/std/http/file_server.ts" in result["packages"]["deno"]
-    
+@functools.lru_cache(maxsize=1024)
+def _file_index(files):
+    """Paths-plus-basenames frozenset, memoized per distinct file tuple"""
+    return frozenset(files) | frozenset(os.path.basename(f) for f in files)
+
+
+def check_files(result, must_have=(), must_not_have=()):
+    """
+    Assert file detection via one frozenset index per result
+
+    Exact paths and basenames resolve as C-level set membership; only names
+    that miss the index fall back to the linear suffix scan, instead of one
+    O(n) file_in_list pass per asserted name.
+    """
+    files = result["input_files"]
+    index = _file_index(tuple(files))
+    for filename in must_have:
+        assert filename in index or file_in_list(filename, files), \
+            f"expected {filename} in {files}"
+    for filename in must_not_have:
+        assert filename not in index and not file_in_list(filename, files), \
+            f"did not expect {filename} in {files}"
+
+
+# Case tables are built once at module import and feed a single parametrized
+# test each, instead of one function object per case - collection and
+# per-test frame overhead stay flat as cases are added. Param ids mirror the
+# old one-method-per-case test names.
+
+# (command, expected sub_commands or None to skip the check,
+#  files that must be detected, files that must NOT be detected)
+FILE_DETECTION_CASES = [
+    # Simple, single-file commands
+    pytest.param("python script.py", ["python script.py"],
+                 ["script.py"], [], id="simple_python_script"),
+    pytest.param("cat readme.txt", ["cat readme.txt"],
+                 ["readme.txt"], [], id="cat_single_file"),
+    pytest.param("grep pattern file.log", ["grep pattern file.log"],
+                 ["file.log"], [], id="grep_in_file"),
+    # Pipes
+    pytest.param("cat file.txt | grep pattern", ["cat file.txt", "grep pattern"],
+                 ["file.txt"], [], id="simple_pipe"),
+    pytest.param("cat data.csv | sort | uniq", ["cat data.csv", "sort", "uniq"],
+                 ["data.csv"], [], id="multiple_pipes"),
+    pytest.param("grep foo file.txt | sort | uniq > output.txt",
+                 ["grep foo file.txt", "sort", "uniq > output.txt"],
+                 ["file.txt"], [], id="pipe_with_output_redirect"),
+    pytest.param("python a.py | tee b.log", ["python a.py", "tee b.log"],
+                 ["a.py", "b.log"], [], id="pipe_with_tee"),
+    # Input/output redirections
+    pytest.param("python script.py < input.txt", ["python script.py < input.txt"],
+                 ["input.txt", "script.py"], [], id="input_redirect"),
+    pytest.param("cat source.txt > dest.txt", ["cat source.txt > dest.txt"],
+                 ["source.txt"], [], id="output_redirect"),
+    # Note: "test" might be detected as a file; check only for non-log files
+    pytest.param("echo test >> log.txt", ["echo test >> log.txt"],
+                 [], ["log.txt"], id="append_redirect"),
+    # Output files are excluded
+    pytest.param("python script.py < input.txt > output.txt",
+                 ["python script.py < input.txt > output.txt"],
+                 ["input.txt", "script.py"], ["output.txt"], id="input_and_output_redirect"),
+    pytest.param("python script.py 2> error.log", ["python script.py 2> error.log"],
+                 ["script.py"], [], id="stderr_redirect"),
+    pytest.param("python test.py &> output.log", ["python test.py &> output.log"],
+                 ["test.py"], [], id="combined_stdout_stderr_redirect"),
+    # Multiple file arguments
+    pytest.param("cat file1.txt file2.txt file3.txt", ["cat file1.txt file2.txt file3.txt"],
+                 ["file1.txt", "file2.txt", "file3.txt"], [], id="cat_multiple_files"),
+    pytest.param("diff old.py new.py", ["diff old.py new.py"],
+                 ["old.py", "new.py"], [], id="diff_two_files"),
+    pytest.param("cat file1.txt file2.txt | grep pattern > result.txt", None,
+                 ["file1.txt", "file2.txt"], ["result.txt"], id="concat_with_output"),
+    # File detection heuristics
+    pytest.param("cat Makefile", ["cat Makefile"],
+                 ["Makefile"], [], id="special_filenames_recognized"),
+    pytest.param("tar -xzf archive.tar.gz", ["tar -xzf archive.tar.gz"],
+                 ["archive.tar.gz"], [], id="archive_files_recognized"),
+    pytest.param("cat package.json", ["cat package.json"],
+                 ["package.json"], [], id="json_files_recognized"),
+    # /dev/null might be detected, that's ok - just verify it doesn't crash
+    pytest.param("cat /dev/null", ["cat /dev/null"],
+                 [], [], id="dev_files_excluded"),
+    # Complex command combinations
+    pytest.param("cat input.txt | sed 's/foo/bar/g' > output.txt", None,
+                 ["input.txt"], ["output.txt"], id="command_with_sed"),
+    pytest.param("awk '{print $1}' data.csv", ["awk '{print $1}' data.csv"],
+                 ["data.csv"], [], id="awk_with_file"),
+    pytest.param("sort input.txt -o sorted.txt", None,
+                 ["input.txt"], [], id="sort_with_output_file"),
+    pytest.param("cat file1.txt; cat file2.txt", None,
+                 ["file1.txt", "file2.txt"], [], id="multiple_commands_semicolon"),
+    pytest.param("test -f config.json && cat config.json", None,
+                 ["config.json"], [], id="logical_and"),
+    pytest.param("cat file1.txt || cat file2.txt", None,
+                 ["file1.txt", "file2.txt"], [], id="logical_or"),
+    # Real-world command examples
+    pytest.param("python analyze.py --input data.csv --verbose > results.log", None,
+                 ["analyze.py", "data.csv"], ["results.log"], id="python_with_args_and_redirect"),
+    pytest.param("git diff file1.py file2.py", None,
+                 ["file1.py", "file2.py"], [], id="git_diff_with_files"),
+    pytest.param("node server.js", ["node server.js"],
+                 ["server.js"], [], id="nodejs_script"),
+    pytest.param("gcc -o program main.c utils.c", None,
+                 ["main.c", "utils.c"], [], id="compile_command"),
+    pytest.param("make -f Makefile.dev", None,
+                 ["Makefile.dev"], [], id="makefile_execution"),
+]
+
+# (command, expected sub_commands, exact expected input_files)
+EXACT_FILES_CASES = [
+    pytest.param("cat /tmp/test.txt", ["cat /tmp/test.txt"],
+                 ["/tmp/test.txt"], id="file_with_path"),
+    pytest.param("echo hello world", ["echo hello world"],
+                 [], id="no_files_in_command"),
+    pytest.param("ls -la -h", ["ls -la -h"],
+                 [], id="options_not_detected_as_files"),
+    pytest.param("ls /tmp", ["ls /tmp"],
+                 [], id="directory_paths_excluded"),
+    pytest.param("ls *.txt", ["ls *.txt"],
+                 [], id="glob_patterns_excluded"),
+    pytest.param("echo $HOME", ["echo $HOME"],
+                 [], id="shell_variables_excluded"),
+]
+
+# Commands that only need to parse gracefully (bashlex may fail and fall
+# back) - the result structure is checked, not its contents
+ROBUSTNESS_CASES = [
+    pytest.param("", id="empty_command"),
+    pytest.param("   ", id="whitespace_only"),
+    pytest.param("echo 'unclosed", id="unclosed_quote"),
+    pytest.param("|||", id="invalid_syntax"),
+    # Should not extract docker paths as files
+    pytest.param("docker cp container:/app/config.json ./config.json", id="docker_copy_command"),
+    # URL might be detected as a file due to .json extension, which is acceptable
+    pytest.param("curl https://example.com/data.json -o output.json", id="curl_output"),
+    # "lein run" may not detect packages without proper arguments
+    pytest.param("lein run -m myapp.core", id="clojure_lein"),
+    # mix run -e evaluates code, doesn't install packages
+    pytest.param('mix run -e "IO.puts(:hello)"', id="mix_run_script"),
+]
+
+# (command, packages that must be detected as (ecosystem, package) pairs,
+#  packages that must NOT be detected)
+PACKAGE_CASES = [
+    # Node.js ecosystem
+    pytest.param("npx prettier --write .", [(NODE, "prettier")], [], id="node_npx"),
+    pytest.param("bunx create-next-app", [(NODE, "create-next-app")], [], id="node_bunx"),
+    pytest.param("yarn dlx create-react-app my-app", [(NODE, "create-react-app")], [], id="node_yarn_dlx"),
+    pytest.param("npm install @babel/core", [(NODE, "@babel/core")], [], id="scoped_package"),
+    pytest.param("npm install react@18.2.0", [(NODE, "react@18.2.0")], [], id="versioned_package"),
+    pytest.param("npm install express mongoose cors",
+                 [(NODE, "express"), (NODE, "mongoose"), (NODE, "cors")], [],
+                 id="multiple_packages_npm"),
+    pytest.param("pnpm install typescript", [(NODE, "typescript")], [], id="pnpm_install"),
+    pytest.param("pnpm i lodash", [(NODE, "lodash")], [], id="pnpm_i_shorthand"),
+    pytest.param("yarn add axios", [(NODE, "axios")], [], id="yarn_add"),
+    pytest.param("npm install 'lodash'", [(NODE, "lodash")], [], id="quoted_package_name"),
+    pytest.param("npm install git+https://github.com/user/repo.git",
+                 [(NODE, "git+https://github.com/user/repo.git")], [], id="npm_install_git_url"),
+    pytest.param("npm i -gS typescript", [(NODE, "typescript")], [], id="npm_combined_short_flags"),
+    pytest.param("npm install -g typescript", [(NODE, "typescript")], [], id="npm_install_global"),
+    pytest.param("npm exec prettier --write .", [(NODE, "prettier")], [], id="npm_exec"),
+    pytest.param("npm exec prettier", [(NODE, "prettier")], [], id="npm_exec_bare"),
+    pytest.param("yarn global add typescript", [(NODE, "typescript")], [], id="yarn_global_add"),
+    pytest.param("yarn global add eslint", [(NODE, "eslint")], [], id="yarn_global_add_eslint"),
+    pytest.param("volta run node script.js", [(NODE, "node")], [], id="volta_run"),
+    pytest.param("pnpx create-vite my-app", [(NODE, "create-vite")], [], id="pnpx_package"),
+    pytest.param("component install component/jquery", [(NODE, "component/jquery")], [], id="component_install"),
+    pytest.param("volo add jquery", [(NODE, "jquery")], [], id="volo_add"),
+    pytest.param("ender build jeesh", [(NODE, "jeesh")], [], id="ender_build"),
+    pytest.param("npx -y prettier --write .", [(NODE, "prettier")], [], id="package_with_flags"),
+    # pip install with a path should not extract the path as a package
+    pytest.param("npm install ./local-package", [], [(NODE, "./local-package")], id="exclude_file_paths"),
+    # Python ecosystem
+    pytest.param("pip install requests numpy pandas",
+                 [(PYTHON, "requests"), (PYTHON, "numpy"), (PYTHON, "pandas")], [],
+                 id="multiple_packages_pip"),
+    pytest.param("poetry add fastapi", [(PYTHON, "fastapi")], [], id="poetry_add"),
+    pytest.param("uv add django", [(PYTHON, "django")], [], id="uv_add"),
+    pytest.param("pip3 install requests", [(PYTHON, "requests")], [], id="pip3_install"),
+    pytest.param("python -m pip install numpy", [(PYTHON, "numpy")], [], id="python_m_pip_install"),
+    pytest.param("python3 -m pip install pandas", [(PYTHON, "pandas")], [], id="python3_m_pip_install"),
+    # Packages with extras (brackets)
+    pytest.param('pip install "apache-airflow[postgres,google]"',
+                 [(PYTHON, "apache-airflow[postgres,google]")], [], id="pip_with_extras"),
+    # pip install -e should not extract package (it's a path)
+    pytest.param("pip install -e .", [], [(PYTHON, ".")], id="pip_editable_install"),
+    # pip install -r should not extract file as package
+    pytest.param("pip install -r requirements.txt", [], [(PYTHON, "requirements.txt")],
+                 id="pip_requirements_file"),
+    # Edge case: pip install -r with additional packages should get those packages
+    pytest.param("pip install -r requirements.txt requests numpy",
+                 [(PYTHON, "requests"), (PYTHON, "numpy")],
+                 [(PYTHON, "requirements.txt")], id="pip_requirements_with_packages"),
+    pytest.param("pip install 'numpy>=1.20.0'", [(PYTHON, "numpy>=1.20.0")], [], id="version_constraints"),
+    pytest.param("pip install file:///path/to/package",
+                 [(PYTHON, "file:///path/to/package")], [], id="pip_install_file_url"),
+    pytest.param("pip install 'django>=3.0,<4.0'",
+                 [(PYTHON, "django>=3.0,<4.0")], [], id="pip_complex_version_constraint"),
+    pytest.param("uvx ruff check .", [(PYTHON, "ruff")], [], id="python_uvx"),
+    pytest.param("uvx https://github.com/jlowin/fastmcp",
+                 [(PYTHON, "https://github.com/jlowin/fastmcp")], [], id="python_uvx_with_url"),
+    pytest.param("pipx run pycowsay hello", [(PYTHON, "pycowsay")], [], id="python_pipx_run"),
+    pytest.param("pipx install poetry", [(PYTHON, "poetry")], [], id="python_pipx_install"),
+    pytest.param("conda install numpy", [(PYTHON, "numpy")], [], id="python_conda"),
+    pytest.param("pip install requests", [(PYTHON, "requests")], [], id="pip_install"),
+    pytest.param("uv pip install fastapi", [(PYTHON, "fastapi")], [], id="uv_pip_install"),
+    pytest.param("uv pip install django", [(PYTHON, "django")], [], id="uv_pip_install_django"),
+    pytest.param("poetry run pytest", [(PYTHON, "pytest")], [], id="poetry_run"),
+    pytest.param("poetry run python script.py", [(PYTHON, "python")], [], id="poetry_run_script"),
+    pytest.param("pyenv install 3.11.0", [(PYTHON, "3.11.0")], [], id="pyenv_install"),
+    pytest.param("mamba install pytorch", [(PYTHON, "pytorch")], [], id="mamba_package"),
+    pytest.param("micromamba install xtensor", [(PYTHON, "xtensor")], [], id="micromamba_package"),
+    pytest.param("pixi run python script.py", [(PYTHON, "python")], [], id="pixi_run_package"),
+    pytest.param("uvx ruff check . | tee output.log", [(PYTHON, "ruff")], [],
+                 id="chain_with_pipes_and_packages"),
+    # Deno
+    pytest.param("deno run https://deno.land/std/examples/welcome.ts",
+                 [(DENO, "https://deno.land/std/examples/welcome.ts")], [], id="deno_run"),
+    # The URL is the package, not the name (-n serve is just the command name)
+    pytest.param("deno install -n serve https://deno.land/std/http/file_server.ts",
+                 [(DENO, "https://deno.land/std/http/file_server.ts")], [], id="deno_install_url"),
     # Rust
-    def test_cargo_run_example(self):
-        result = parse_shell_command("cargo run --example demo")
-        assert "rust" in result["packages"]
-        assert "demo" in result["packages"]["rust"]
-    
-    def test_cargo_binstall_package(self):
-        result = parse_shell_command("cargo-binstall ripgrep")
-        assert "rust" in result["packages"]
-        assert "ripgrep" in result["packages"]["rust"]
-    
-    def test_cargo_quickinstall_package(self):
-        result = parse_shell_command("cargo quickinstall ripgrep")
-        assert "rust" in result["packages"]
-        assert "ripgrep" in result["packages"]["rust"]
-    
-    def test_rustup_run_nightly(self):
-        result = parse_shell_command("rustup run nightly cargo build")
-        assert "rust" in result["packages"]
-        assert "nightly" in result["packages"]["rust"]
-    
-    # Go with URLs
-    def test_go_run_with_url(self):
-        result = parse_shell_command("go run github.com/golang/example/hello@latest")
-        assert "go" in result["packages"]
-        assert "github.com/golang/example/hello@latest" in result["packages"]["go"]
-    
+    pytest.param("cargo add serde", [(RUST, "serde")], [], id="cargo_add"),
+    pytest.param("cargo install ripgrep", [(RUST, "ripgrep")], [], id="rust_cargo_install"),
+    pytest.param("cargo run --example demo", [(RUST, "demo")], [], id="cargo_run_example"),
+    pytest.param("cargo-binstall ripgrep", [(RUST, "ripgrep")], [], id="cargo_binstall_package"),
+    pytest.param("cargo quickinstall ripgrep", [(RUST, "ripgrep")], [], id="cargo_quickinstall_package"),
+    pytest.param("rustup run nightly cargo build", [(RUST, "nightly")], [], id="rustup_run_nightly"),
+    # Go
+    pytest.param("go install github.com/user/tool@latest",
+                 [(GO, "github.com/user/tool@latest")], [], id="go_install_full_path"),
+    # Go modules with /... suffix (recursive import)
+    pytest.param("go install github.com/junegunn/fzf/...@latest",
+                 [(GO, "github.com/junegunn/fzf/...@latest")], [], id="go_install_with_ellipsis"),
+    pytest.param("go install github.com/junegunn/fzf@latest",
+                 [(GO, "github.com/junegunn/fzf@latest")], [], id="go_install"),
+    pytest.param("go run github.com/golang/example/hello@latest",
+                 [(GO, "github.com/golang/example/hello@latest")], [], id="go_run"),
     # Ruby
-    def test_bundle_exec(self):
-        result = parse_shell_command("bundle exec rails server")
-        assert "ruby" in result["packages"]
-        assert "rails" in result["packages"]["ruby"]
-    
-    def test_rbenv_install_version(self):
-        result = parse_shell_command("rbenv install 3.2.0")
-        assert "ruby" in result["packages"]
-        assert "3.2.0" in result["packages"]["ruby"]
-    
+    pytest.param("bundle add rspec", [(RUBY, "rspec")], [], id="bundle_add"),
+    pytest.param("gem install rails", [(RUBY, "rails")], [], id="ruby_gem_install"),
+    pytest.param("bundle exec rails server", [(RUBY, "rails")], [], id="bundle_exec"),
+    pytest.param("bundle exec rake test", [(RUBY, "rake")], [], id="bundle_exec_rake"),
+    pytest.param("rbenv install 3.2.0", [(RUBY, "3.2.0")], [], id="rbenv_install_version"),
     # Java
-    def test_cs_launch(self):
-        result = parse_shell_command("cs launch scala3-repl")
-        assert "java" in result["packages"]
-        assert "scala3-repl" in result["packages"]["java"]
-    
-    def test_jgo_coordinates(self):
-        result = parse_shell_command("jgo com.example:tool:1.0.0")
-        assert "java" in result["packages"]
-        assert "com.example:tool:1.0.0" in result["packages"]["java"]
-    
-    def test_jbang_file(self):
-        result = parse_shell_command("jbang hello.java")
-        assert "java" in result["packages"]
-        assert "hello.java" in result["packages"]["java"]
-    
-    def test_jbang_url(self):
-        result = parse_shell_command("jbang https://github.com/user/repo/script.java")
-        assert "java" in result["packages"]
-        assert "https://github.com/user/repo/script.java" in result["packages"]["java"]
-    
+    pytest.param("jbang hello.java", [(JAVA, "hello.java")], [], id="java_jbang"),
+    pytest.param("coursier launch scala3-repl", [(JAVA, "scala3-repl")], [], id="java_coursier"),
+    pytest.param("cs launch scala3-repl", [(JAVA, "scala3-repl")], [], id="cs_launch"),
+    pytest.param("cs launch ammonite", [(JAVA, "ammonite")], [], id="cs_launch_ammonite"),
+    pytest.param("jgo com.example:tool:1.0.0", [(JAVA, "com.example:tool:1.0.0")], [], id="jgo_coordinates"),
+    pytest.param("jbang https://github.com/user/repo/script.java",
+                 [(JAVA, "https://github.com/user/repo/script.java")], [], id="jbang_url"),
     # Scala
-    def test_mill_run_target(self):
-        result = parse_shell_command("mill run app.main")
-        assert "scala" in result["packages"]
-        assert "app.main" in result["packages"]["scala"]
-    
-    def test_ammonite_package(self):
-        result = parse_shell_command("ammonite script.sc")
-        assert "scala" in result["packages"]
-        assert "script.sc" in result["packages"]["scala"]
-    
+    pytest.param("mill run app.main", [(SCALA, "app.main")], [], id="mill_run_target"),
+    pytest.param("ammonite script.sc", [(SCALA, "script.sc")], [], id="ammonite_package"),
     # Clojure
-    def test_clj_sdeps(self):
-        result = parse_shell_command("clj -Sdeps '{:deps {hiccup/hiccup {:mvn/version \"2.0.0\"}}}'")
-        assert "clojure" in result["packages"]
-        # The first package after -Sdeps
-    
-    def test_babashka_full_name(self):
-        result = parse_shell_command("babashka script.clj")
-        assert "clojure" in result["packages"]
-        assert "script.clj" in result["packages"]["clojure"]
-    
-    def test_babashka_script(self):
-        result = parse_shell_command("bb script.clj")
-        assert "clojure" in result["packages"]
-        assert "script.clj" in result["packages"]["clojure"]
-    
-    # Nix
-    def test_nix_shell_package(self):
-        result = parse_shell_command("nix shell nixpkgs#python3")
-        assert "nix" in result["packages"]
-        assert "nixpkgs#python3" in result["packages"]["nix"]
-    
-    def test_nix_shell_with_flag(self):
-        result = parse_shell_command("nix-shell -p cowsay --run 'cowsay moo'")
-        assert "nix" in result["packages"]
-        assert "cowsay" in result["packages"]["nix"]
-    
-    def test_guix_shell_package(self):
-        result = parse_shell_command("guix shell python -- python3")
-        assert "guix" in result["packages"]
-        assert "python" in result["packages"]["guix"]
-    
+    pytest.param("babashka script.clj", [(CLOJURE, "script.clj")], [], id="babashka_full_name"),
+    pytest.param("bb script.clj", [(CLOJURE, "script.clj")], [], id="babashka_script"),
     # Docker/Containers
-    def test_kubectl_run_image(self):
-        result = parse_shell_command("kubectl run tmp --image=busybox -it")
-        assert "docker" in result["packages"]
-        # kubectl run has complex syntax; --image=value format may not parse perfectly
-        # But we should at least detect it as a docker-related command
-        # The actual package might be 'tmp' or nothing due to --image= parsing
-        assert len(result["packages"]["docker"]) >= 0  # May be empty due to --image= syntax
-    
+    pytest.param("docker run python:3.11-slim", [(DOCKER, "python:3.11-slim")], [], id="docker_image_with_tag"),
+    pytest.param("docker run python:3.11", [(DOCKER, "python:3.11")], [], id="docker_run"),
+    pytest.param("podman run -it alpine", [(DOCKER, "alpine")], [], id="podman_run"),
+    pytest.param("docker run python:3.11 && docker run node:18",
+                 [(DOCKER, "python:3.11"), (DOCKER, "node:18")], [], id="multiple_docker_images"),
+    # Nix/Guix
+    pytest.param("nix run nixpkgs#cowsay", [(NIX, "nixpkgs#cowsay")], [], id="nix_run"),
+    pytest.param("nix shell nixpkgs#ripgrep", [(NIX, "nixpkgs#ripgrep")], [], id="nix_shell"),
+    pytest.param("nix shell nixpkgs#python3", [(NIX, "nixpkgs#python3")], [], id="nix_shell_package"),
+    pytest.param("nix-shell -p cowsay --run 'cowsay moo'", [(NIX, "cowsay")], [], id="nix_shell_with_flag"),
+    pytest.param("guix shell python -- python3", [(GUIX, "python")], [], id="guix_shell_package"),
+    pytest.param("guix shell python", [(GUIX, "python")], [], id="guix_shell_separate_category"),
     # Linux sandboxing
-    def test_flatpak_run(self):
-        result = parse_shell_command("flatpak run org.gnome.Calculator")
-        assert "linux" in result["packages"]
-        assert "org.gnome.Calculator" in result["packages"]["linux"]
-    
-    def test_snap_run(self):
-        result = parse_shell_command("snap run discord")
-        assert "linux" in result["packages"]
-        assert "discord" in result["packages"]["linux"]
-    
+    pytest.param("flatpak run org.gnome.Calculator", [(LINUX, "org.gnome.Calculator")], [], id="flatpak_run"),
+    pytest.param("snap run discord", [(LINUX, "discord")], [], id="snap_run"),
     # Haskell
-    def test_cabal_run_exe(self):
-        result = parse_shell_command("cabal run exe:myapp")
-        assert "haskell" in result["packages"]
-        assert "exe:myapp" in result["packages"]["haskell"]
-    
-    def test_ghcup_install_version(self):
-        result = parse_shell_command("ghcup install ghc 9.4.5")
-        assert "haskell" in result["packages"]
-        assert "ghc" in result["packages"]["haskell"]
-    
+    pytest.param("stack run --package pandoc", [(HASKELL, "pandoc")], [], id="haskell_stack"),
+    pytest.param("cabal run exe:myapp", [(HASKELL, "exe:myapp")], [], id="cabal_run_exe"),
+    pytest.param("ghcup install ghc 9.4.5", [(HASKELL, "ghc")], [], id="ghcup_install_version"),
     # OCaml
-    def test_esy_latest(self):
-        result = parse_shell_command("esy @latest")
-        assert "ocaml" in result["packages"]
-        assert "@latest" in result["packages"]["ocaml"]
-    
-    # Elixir
-    def test_mix_run_script(self):
-        result = parse_shell_command("mix run -e \"IO.puts(:hello)\"")
-        # mix run -e evaluates code, doesn't install packages
-        # So we don't expect packages to be detected
-    
+    pytest.param("opam install dune", [(OCAML, "dune")], [], id="ocaml_opam"),
+    pytest.param("esy @latest", [(OCAML, "@latest")], [], id="esy_latest"),
     # Dart
-    def test_flutter_pub_run_build(self):
-        result = parse_shell_command("flutter pub run build_runner build")
-        assert "dart" in result["packages"]
-        assert "build_runner" in result["packages"]["dart"]
-    
+    pytest.param("dart pub global activate webdev", [(DART, "webdev")], [], id="dart_pub"),
+    pytest.param("flutter pub run build_runner build", [(DART, "build_runner")], [], id="flutter_pub_run_build"),
     # PHP
-    def test_composer_global_require(self):
-        result = parse_shell_command("composer global require phpunit/phpunit")
-        assert "php" in result["packages"]
-        assert "phpunit/phpunit" in result["packages"]["php"]
-    
-    def test_phive_install_tool(self):
-        result = parse_shell_command("phive install phpunit")
-        assert "php" in result["packages"]
-        assert "phpunit" in result["packages"]["php"]
-    
+    pytest.param("composer global require phpunit/phpunit", [(PHP, "phpunit/phpunit")], [], id="php_composer"),
+    pytest.param("phive install phpunit", [(PHP, "phpunit")], [], id="phive_install_tool"),
     # Perl
-    def test_cpanm_module(self):
-        result = parse_shell_command("cpanm Mojolicious")
-        assert "perl" in result["packages"]
-        assert "Mojolicious" in result["packages"]["perl"]
-    
-    def test_cpm_install_module(self):
-        result = parse_shell_command("cpm install Plack")
-        assert "perl" in result["packages"]
-        assert "Plack" in result["packages"]["perl"]
-    
-    def test_ppm_install_module(self):
-        result = parse_shell_command("ppm install DBD-mysql")
-        assert "perl" in result["packages"]
-        assert "DBD-mysql" in result["packages"]["perl"]
-    
+    pytest.param("cpanm Mojolicious", [(PERL, "Mojolicious")], [], id="cpanm_module"),
+    pytest.param("cpm install Plack", [(PERL, "Plack")], [], id="cpm_install_module"),
+    pytest.param("ppm install DBD-mysql", [(PERL, "DBD-mysql")], [], id="ppm_install_module"),
     # Lua
-    def test_luarocks_install_module(self):
-        result = parse_shell_command("luarocks install moonscript")
-        assert "lua" in result["packages"]
-        assert "moonscript" in result["packages"]["lua"]
-    
+    pytest.param("luarocks install moonscript", [(LUA, "moonscript")], [], id="luarocks_install_module"),
     # Swift
-    def test_mint_run_repo(self):
-        result = parse_shell_command("mint run realm/SwiftLint")
-        assert "swift" in result["packages"]
-        assert "realm/SwiftLint" in result["packages"]["swift"]
-    
-    def test_marathon_run_script(self):
-        result = parse_shell_command("marathon run script.swift")
-        assert "swift" in result["packages"]
-        assert "script.swift" in result["packages"]["swift"]
-    
-    def test_carthage_update(self):
-        result = parse_shell_command("carthage update")
-        # carthage update doesn't take package argument directly
-        assert result["packages"] == {}
-    
+    pytest.param("mint run realm/SwiftLint", [(SWIFT, "realm/SwiftLint")], [], id="swift_mint"),
+    pytest.param("marathon run script.swift", [(SWIFT, "script.swift")], [], id="marathon_run_script"),
     # WebAssembly
-    def test_wasmer_run_package(self):
-        result = parse_shell_command("wasmer run cowsay")
-        assert "wasm" in result["packages"]
-        assert "cowsay" in result["packages"]["wasm"]
-    
-    def test_wapm_install_package(self):
-        result = parse_shell_command("wapm install cowsay")
-        assert "wasm" in result["packages"]
-        assert "cowsay" in result["packages"]["wasm"]
-    
-    def test_wasm_pack_build(self):
-        result = parse_shell_command("wasm-pack build")
-        # wasm-pack build doesn't take package argument
-        assert result["packages"] == {}
-    
+    pytest.param("wasmer run cowsay", [(WASM, "cowsay")], [], id="wasm_wasmer"),
+    pytest.param("wapm install cowsay", [(WASM, "cowsay")], [], id="wapm_install_package"),
     # C/C++
-    def test_conan_install_package(self):
-        result = parse_shell_command("conan install poco/1.12.4@")
-        assert "cpp" in result["packages"]
-        assert "poco/1.12.4@" in result["packages"]["cpp"]
-    
-    def test_vcpkg_install_library(self):
-        result = parse_shell_command("vcpkg install boost")
-        assert "cpp" in result["packages"]
-        assert "boost" in result["packages"]["cpp"]
-    
-    def test_clib_install_repo(self):
-        result = parse_shell_command("clib install stephenmathieson/batch.c")
-        assert "cpp" in result["packages"]
-        assert "stephenmathieson/batch.c" in result["packages"]["cpp"]
-    
-    def test_buckaroo_install_repo(self):
-        result = parse_shell_command("buckaroo install google/googletest")
-        assert "cpp" in result["packages"]
-        assert "google/googletest" in result["packages"]["cpp"]
-    
+    pytest.param("conan install poco/1.12.4@", [(CPP, "poco/1.12.4@")], [], id="cpp_conan"),
+    pytest.param("vcpkg install boost", [(CPP, "boost")], [], id="vcpkg_install_library"),
+    pytest.param("clib install stephenmathieson/batch.c",
+                 [(CPP, "stephenmathieson/batch.c")], [], id="clib_install_repo"),
+    pytest.param("buckaroo install google/googletest",
+                 [(CPP, "google/googletest")], [], id="buckaroo_install_repo"),
     # System package managers
-    def test_scoop_install_package(self):
-        result = parse_shell_command("scoop install curl")
-        assert "system" in result["packages"]
-        assert "curl" in result["packages"]["system"]
-    
-    def test_winget_install_package(self):
-        result = parse_shell_command("winget install Mozilla.Firefox")
-        assert "system" in result["packages"]
-        assert "Mozilla.Firefox" in result["packages"]["system"]
-    
-    def test_chocolatey_install_package(self):
-        result = parse_shell_command("chocolatey install git")
-        assert "system" in result["packages"]
-        assert "git" in result["packages"]["system"]
-    
-    def test_choco_install_package(self):
-        result = parse_shell_command("choco install git")
-        assert "system" in result["packages"]
-        assert "git" in result["packages"]["system"]
-    
-    def test_yum_install_package(self):
-        result = parse_shell_command("yum install git")
-        assert "system" in result["packages"]
-        assert "git" in result["packages"]["system"]
-    
-    def test_dnf_install_package(self):
-        result = parse_shell_command("dnf install nodejs")
-        assert "system" in result["packages"]
-        assert "nodejs" in result["packages"]["system"]
-    
-    def test_pacman_s_package(self):
-        result = parse_shell_command("pacman -S firefox")
-        assert "system" in result["packages"]
-        assert "firefox" in result["packages"]["system"]
-    
-    def test_zypper_install_package(self):
-        result = parse_shell_command("zypper install docker")
-        assert "system" in result["packages"]
-        assert "docker" in result["packages"]["system"]
-    
-    def test_apk_add_package(self):
-        result = parse_shell_command("apk add bash")
-        assert "system" in result["packages"]
-        assert "bash" in result["packages"]["system"]
-    
-    def test_pkg_install_package(self):
-        result = parse_shell_command("pkg install nginx")
-        assert "system" in result["packages"]
-        assert "nginx" in result["packages"]["system"]
-    
-    def test_emerge_package(self):
-        result = parse_shell_command("emerge firefox")
-        assert "system" in result["packages"]
-        assert "firefox" in result["packages"]["system"]
-    
-    def test_xbps_install_package(self):
-        result = parse_shell_command("xbps-install firefox")
-        assert "system" in result["packages"]
-        assert "firefox" in result["packages"]["system"]
-    
-    def test_pkgin_install_package(self):
-        result = parse_shell_command("pkgin install git")
-        assert "system" in result["packages"]
-        assert "git" in result["packages"]["system"]
-    
-    def test_opkg_install_package(self):
-        result = parse_shell_command("opkg install luci")
-        assert "system" in result["packages"]
-        assert "luci" in result["packages"]["system"]
-    
+    pytest.param("brew install wget", [(SYSTEM, "wget")], [], id="system_brew"),
+    pytest.param("apt install curl", [(SYSTEM, "curl")], [], id="system_apt"),
+    pytest.param("apt-get install curl", [(SYSTEM, "curl")], [], id="apt_get_install"),
+    pytest.param("scoop install curl", [(SYSTEM, "curl")], [], id="scoop_install_package"),
+    pytest.param("winget install Mozilla.Firefox", [(SYSTEM, "Mozilla.Firefox")], [], id="winget_install_package"),
+    pytest.param("chocolatey install git", [(SYSTEM, "git")], [], id="chocolatey_install_package"),
+    pytest.param("choco install git", [(SYSTEM, "git")], [], id="choco_install_package"),
+    pytest.param("yum install git", [(SYSTEM, "git")], [], id="yum_install_package"),
+    pytest.param("dnf install nodejs", [(SYSTEM, "nodejs")], [], id="dnf_install_package"),
+    pytest.param("pacman -S firefox", [(SYSTEM, "firefox")], [], id="pacman_s_package"),
+    pytest.param("zypper install docker", [(SYSTEM, "docker")], [], id="zypper_install_package"),
+    pytest.param("apk add bash", [(SYSTEM, "bash")], [], id="apk_add_package"),
+    pytest.param("pkg install nginx", [(SYSTEM, "nginx")], [], id="pkg_install_package"),
+    pytest.param("emerge firefox", [(SYSTEM, "firefox")], [], id="emerge_package"),
+    pytest.param("xbps-install firefox", [(SYSTEM, "firefox")], [], id="xbps_install_package"),
+    pytest.param("pkgin install git", [(SYSTEM, "git")], [], id="pkgin_install_package"),
+    pytest.param("opkg install luci", [(SYSTEM, "luci")], [], id="opkg_install_package"),
     # Version managers
-    def test_asdf_install_version(self):
-        result = parse_shell_command("asdf install nodejs 18.0.0")
-        assert "version" in result["packages"]
-        assert "nodejs" in result["packages"]["version"]
-    
-    def test_volta_install_node(self):
-        result = parse_shell_command("volta install node@18")
-        assert "version" in result["packages"]
-        assert "node@18" in result["packages"]["version"]
-    
-    def test_fnm_use_version(self):
-        result = parse_shell_command("fnm use 18")
-        assert "version" in result["packages"]
-        assert "18" in result["packages"]["version"]
-    
-    def test_juliaup_add_version(self):
-        result = parse_shell_command("juliaup add 1.9")
-        assert "version" in result["packages"]
-        assert "1.9" in result["packages"]["version"]
-    
+    pytest.param("asdf install nodejs 18.0.0", [(VERSION, "nodejs")], [], id="asdf_install_version"),
+    pytest.param("volta install node@18", [(VERSION, "node@18")], [], id="volta_install_node"),
+    pytest.param("fnm use 18", [(VERSION, "18")], [], id="fnm_use_version"),
+    pytest.param("juliaup add 1.9", [(VERSION, "1.9")], [], id="juliaup_add_version"),
     # HPC
-    def test_spack_install_package(self):
-        result = parse_shell_command("spack install hdf5")
-        assert "hpc" in result["packages"]
-        assert "hdf5" in result["packages"]["hpc"]
-    
-    def test_easybuild_package(self):
-        result = parse_shell_command("easybuild TensorFlow-2.11.0.eb")
-        assert "hpc" in result["packages"]
-        assert "TensorFlow-2.11.0.eb" in result["packages"]["hpc"]
-    
+    pytest.param("spack install hdf5", [(HPC, "hdf5")], [], id="spack_install_package"),
+    pytest.param("easybuild TensorFlow-2.11.0.eb", [(HPC, "TensorFlow-2.11.0.eb")], [], id="easybuild_package"),
     # Build systems
-    def test_buck2_run_target(self):
-        result = parse_shell_command("buck2 run //app:main")
-        assert "build" in result["packages"]
-        assert "//app:main" in result["packages"]["build"]
-    
-    def test_earthly_target(self):
-        result = parse_shell_command("earthly +build")
-        assert "build" in result["packages"]
-        assert "+build" in result["packages"]["build"]
-    
-    def test_pants_run_target(self):
-        result = parse_shell_command("pants run ::")
-        assert "build" in result["packages"]
-        assert "::" in result["packages"]["build"]
-    
-    def test_depot_build(self):
-        result = parse_shell_command("depot build")
-        # depot build doesn't take package argument
-        assert result["packages"] == {}
-    
-    def test_gradle_run_task(self):
-        result = parse_shell_command("gradle run")
-        # gradle run doesn't have package argument typically
-        assert result["packages"] == {}
-    
-    def test_ant_run_target(self):
-        result = parse_shell_command("ant run")
-        # ant run doesn't have package argument typically
-        assert result["packages"] == {}
-    
+    pytest.param("bazel run //my:target", [(BUILD, "//my:target")], [], id="build_bazel"),
+    pytest.param("buck2 run //app:main", [(BUILD, "//app:main")], [], id="buck2_run_target"),
+    pytest.param("earthly +build", [(BUILD, "+build")], [], id="earthly_target"),
+    pytest.param("pants run ::", [(BUILD, "::")], [], id="pants_run_target"),
     # Other languages
-    def test_elm_install_package(self):
-        result = parse_shell_command("elm install elm/http")
-        assert "elm" in result["packages"]
-        assert "elm/http" in result["packages"]["elm"]
-    
-    def test_zig_fetch_url(self):
-        result = parse_shell_command("zig fetch --save git+https://github.com/user/repo")
-        assert "zig" in result["packages"]
-        # Should detect --save as flag and get the URL
-    
-    def test_nimble_install_package(self):
-        result = parse_shell_command("nimble install nim")
-        assert "nim" in result["packages"]
-        assert "nim" in result["packages"]["nim"]
-    
-    def test_shards_install(self):
-        result = parse_shell_command("shards install")
-        # shards install doesn't take package argument
-        assert result["packages"] == {}
-    
-    def test_raco_pkg_install(self):
-        result = parse_shell_command("raco pkg install drracket")
-        assert "racket" in result["packages"]
-        assert "drracket" in result["packages"]["racket"]
-    
-    def test_roswell_install_repo(self):
-        result = parse_shell_command("roswell install fukamachi/qlot")
-        assert "lisp" in result["packages"]
-        assert "fukamachi/qlot" in result["packages"]["lisp"]
-    
-    def test_quicklisp_package(self):
-        result = parse_shell_command("quicklisp install alexandria")
-        assert "lisp" in result["packages"]
-        assert "install" in result["packages"]["lisp"]
-    
-    def test_tlmgr_install_package(self):
-        result = parse_shell_command("tlmgr install babel")
-        assert "tex" in result["packages"]
-        assert "babel" in result["packages"]["tex"]
-    
-    # Critical additions - Node.js
-    def test_npm_install_global_comprehensive(self):
-        result = parse_shell_command("npm install -g typescript")
-        assert "node" in result["packages"]
-        assert "typescript" in result["packages"]["node"]
-    
-    def test_npm_exec_comprehensive(self):
-        result = parse_shell_command("npm exec prettier")
-        assert "node" in result["packages"]
-        assert "prettier" in result["packages"]["node"]
-    
-    def test_yarn_global_add_comprehensive(self):
-        result = parse_shell_command("yarn global add eslint")
-        assert "node" in result["packages"]
-        assert "eslint" in result["packages"]["node"]
-    
-    def test_volta_run_comprehensive(self):
-        result = parse_shell_command("volta run node script.js")
-        assert "node" in result["packages"]
-        assert "node" in result["packages"]["node"]
-    
-    # Critical additions - Python
-    def test_pip_install_comprehensive(self):
-        result = parse_shell_command("pip install requests")
-        assert "python" in result["packages"]
-        assert "requests" in result["packages"]["python"]
-    
-    def test_uv_pip_install_comprehensive(self):
-        result = parse_shell_command("uv pip install django")
-        assert "python" in result["packages"]
-        assert "django" in result["packages"]["python"]
-    
-    def test_poetry_run_comprehensive(self):
-        result = parse_shell_command("poetry run python script.py")
-        assert "python" in result["packages"]
-        assert "python" in result["packages"]["python"]
-    
-    # Critical additions - Ruby
-    def test_bundle_exec_comprehensive(self):
-        result = parse_shell_command("bundle exec rake test")
-        assert "ruby" in result["packages"]
-        assert "rake" in result["packages"]["ruby"]
-    
-    # Critical additions - Java
-    def test_cs_launch_comprehensive(self):
-        result = parse_shell_command("cs launch ammonite")
-        assert "java" in result["packages"]
-        assert "ammonite" in result["packages"]["java"]
-    
-    # Critical additions - Clojure
-    def test_babashka_comprehensive(self):
-        result = parse_shell_command("babashka script.clj")
-        assert "clojure" in result["packages"]
-        assert "script.clj" in result["packages"]["clojure"]
-    
-    # Critical additions - Guix
-    def test_guix_shell_separate_category(self):
-        result = parse_shell_command("guix shell python")
-        assert "guix" in result["packages"]
-        assert "python" in result["packages"]["guix"]
-    
-    # Critical additions - System
-    def test_chocolatey_install_full_name(self):
-        result = parse_shell_command("chocolatey install git")
-        assert "system" in result["packages"]
-        assert "git" in result["packages"]["system"]
-    
-    def test_apt_get_install(self):
-        result = parse_shell_command("apt-get install curl")
-        assert "system" in result["packages"]
-        assert "curl" in result["packages"]["system"]
-    
-    # Critical additions - Build/Lisp
-    def test_quicklisp(self):
-        result = parse_shell_command("quicklisp install alexandria")
-        assert "lisp" in result["packages"]
-        assert "install" in result["packages"]["lisp"]
-
+    pytest.param("elm install elm/http", [(ELM, "elm/http")], [], id="elm_install_package"),
+    pytest.param("nimble install nim", [(NIM, "nim")], [], id="nimble_install_package"),
+    pytest.param("raco pkg install drracket", [(RACKET, "drracket")], [], id="raco_pkg_install"),
+    pytest.param("roswell install fukamachi/qlot", [(LISP, "fukamachi/qlot")], [], id="roswell_install_repo"),
+    pytest.param("quicklisp install alexandria", [(LISP, "install")], [], id="quicklisp_package"),
+    pytest.param("tlmgr install babel", [(TEX, "babel")], [], id="tex_tlmgr"),
+    # Mixed ecosystems in one chain
+    pytest.param("uvx ruff check && npx prettier --write .",
+                 [(PYTHON, "ruff"), (NODE, "prettier")], [], id="mixed_ecosystems"),
+]
+
+# Commands where no packages at all should be detected
+NO_PACKAGE_CASES = [
+    pytest.param("cat file.txt | grep pattern", id="no_packages_detected"),
+    pytest.param("python script.py", id="packages_empty_for_regular_commands"),
+    # "sbt run" doesn't have a package argument, so nothing should be detected
+    pytest.param("sbt run", id="scala_sbt"),
+    pytest.param("carthage update", id="carthage_update"),
+    pytest.param("wasm-pack build", id="wasm_pack_build"),
+    pytest.param("shards install", id="shards_install"),
+    pytest.param("depot build", id="depot_build"),
+    pytest.param("gradle run", id="gradle_run_task"),
+    pytest.param("ant run", id="ant_run_target"),
+]
+
+# Commands where only the ecosystem is asserted - the exact package depends
+# on parsing details that are allowed to vary
+ECOSYSTEM_ONLY_CASES = [
+    pytest.param("clj -Sdeps '{:deps {hiccup/hiccup {:mvn/version \"2.0.0\"}}}'",
+                 CLOJURE, id="clj_sdeps"),
+    pytest.param("zig fetch --save git+https://github.com/user/repo", ZIG, id="zig_fetch_url"),
+    # kubectl run has complex syntax; --image=value format may not parse perfectly
+    pytest.param("kubectl run tmp --image=busybox -it", DOCKER, id="kubectl_run_image"),
+]
+
+
+@pytest.mark.parametrize("command,expected_subs,must_have,must_not_have", FILE_DETECTION_CASES)
+def test_file_detection(parse, command, expected_subs, must_have, must_not_have):
+    result = parse(command)
+    if expected_subs is not None:
+        assert result["sub_commands"] == expected_subs
+    check_files(result, must_have, must_not_have)
+
+
+@pytest.mark.parametrize("command,expected_subs,expected_files", EXACT_FILES_CASES)
+def test_exact_files(parse, command, expected_subs, expected_files):
+    result = parse(command)
+    assert result["sub_commands"] == expected_subs
+    assert result["input_files"] == expected_files
+
+
+@pytest.mark.parametrize("command", ROBUSTNESS_CASES)
+def test_parses_without_crashing(parse, command):
+    # Bashlex might fail, but should fallback gracefully. The result shape
+    # is fixed by parse_shell_command's typed return; these cases only
+    # assert that parsing does not raise
+    parse(command)
+
+
+@pytest.mark.parametrize("command,must_have,must_not_have", PACKAGE_CASES)
+def test_package_detection(parse, command, must_have, must_not_have):
+    packages = parse(command)["packages"]
+    detected = {ecosystem: frozenset(pkgs) for ecosystem, pkgs in packages.items()}
+    for ecosystem, package in must_have:
+        assert ecosystem in detected
+        assert package in detected[ecosystem]
+    for ecosystem, package in must_not_have:
+        assert package not in detected.get(ecosystem, frozenset())
+
+
+@pytest.mark.parametrize("command", NO_PACKAGE_CASES)
+def test_no_packages(parse, command):
+    assert parse(command)["packages"] == {}
+
+
+@pytest.mark.parametrize("command,ecosystem", ECOSYSTEM_ONLY_CASES)
+def test_package_ecosystem_only(parse, command, ecosystem):
+    assert ecosystem in parse(command)["packages"]
+
+
+# Cases whose assertions don't fit the tables above
+
+def test_relative_path_file(parse):
+    result = parse("python src/main.py")
+    assert result["sub_commands"] == ["python src/main.py"]
+    assert file_in_list("main.py", result["input_files"]) or file_in_list("src/main.py", result["input_files"])
+
+
+def test_find_with_xargs(parse):
+    result = parse("find . -name '*.py' | xargs grep pattern")
+    assert len(result["sub_commands"]) >= 1
+    # find and xargs should be separate commands
+    assert any("find" in cmd for cmd in result["sub_commands"])
+
+
+def test_docker_run_with_image_and_tag(parse):
+    result = parse("docker run -it ubuntu:22.04 bash")
+    assert "docker" in result["packages"]
+    # Either ubuntu:22.04 or bash could be detected depending on parsing
+    assert len(result["packages"]["docker"]) > 0
+
+
+def test_multiple_same_ecosystem(parse):
+    result = parse("npx eslint . && npx prettier --write .")
+    assert "node" in result["packages"]
+    assert "eslint" in result["packages"]["node"]
+    assert "prettier" in result["packages"]["node"]
+    assert len(result["packages"]["node"]) == 2
+
+
+def test_package_deduplication(parse):
+    result = parse("npx prettier . && npx prettier .")
+    assert "node" in result["packages"]
+    assert result["packages"]["node"].count("prettier") == 1
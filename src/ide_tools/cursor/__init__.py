@@ -4,8 +4,9 @@ Cursor IDE Handler
 Handles Cursor-specific hooks and operations.
 """
 
-from .router import route_cursor_hook
+from .router import route_cursor_hook, route_cursor_hook_stream
 
 __all__ = [
     "route_cursor_hook",
+    "route_cursor_hook_stream",
 ]
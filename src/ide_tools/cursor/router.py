@@ -8,6 +8,7 @@ import asyncio
 import json
 import sys
 import uuid
+from typing import Union
 
 from ide_tools.common.hooks.init import handle_init
 from ide_tools.common.hooks.prompt_submit import handle_prompt_submit
@@ -21,14 +22,14 @@ from ..common.hooks.output import output_result
 MASK_AFTER_SHELL_EXEC = True
 
 
-def route_cursor_hook(logger: MCPLogger, audit_logger: AuditTrailLogger, stdin_input: str):
+def route_cursor_hook(logger: MCPLogger, audit_logger: AuditTrailLogger, stdin_input: Union[str, bytes]):
     """
     Route Cursor hook to appropriate shared handler
-    
+
     Args:
         logger: MCPLogger instance
         audit_logger: AuditTrailLogger instance
-        stdin_input: Raw input string from stdin
+        stdin_input: Raw input from stdin, str or bytes
     """
     try:
         input_data = json.loads(stdin_input)
@@ -105,3 +106,29 @@ def route_cursor_hook(logger: MCPLogger, audit_logger: AuditTrailLogger, stdin_i
     except Exception as e:
         logger.error(f"Routing error: {e}", exc_info=True)
         sys.exit(1)
+
+
+def route_cursor_hook_stream(logger: MCPLogger, audit_logger: AuditTrailLogger):
+    """
+    Daemon-style loop: one newline-delimited JSON hook request per stdin line,
+    one reply line per request. Reusing a single process amortizes interpreter
+    startup, import graph, and event-loop setup across invocations.
+
+    Handlers finish each request with sys.exit, so SystemExit is caught to
+    keep the loop alive; the exit code is only logged (replies carry the
+    decision in-band).
+
+    Args:
+        logger: MCPLogger instance
+        audit_logger: AuditTrailLogger instance
+    """
+    logger.info("Cursor router: daemon mode started")
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            route_cursor_hook(logger, audit_logger, line)
+        except SystemExit as e:
+            logger.info("Hook request completed (exit code %s)", e.code)
+    logger.info("Cursor router: daemon mode stdin closed, exiting")
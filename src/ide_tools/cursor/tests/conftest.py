@@ -0,0 +1,47 @@
+"""
+Pytest configuration for the Cursor e2e handler tests.
+
+Each test case is an independent subprocess wait, so the suite parallelizes
+cleanly with pytest-xdist: pytest -n auto src/ide_tools/cursor/tests
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+_TESTS_DIR = Path(__file__).parent
+
+# The handlers are spawned through uvx - skip this suite where it is not
+# installed instead of timing out per test
+_requires_uvx = pytest.mark.skipif(
+    shutil.which("uvx") is None,
+    reason="uvx not available - e2e handler tests spawn real uvx subprocesses"
+)
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if Path(item.fspath).parent == _TESTS_DIR:
+            item.add_marker(_requires_uvx)
+
+
+@pytest.fixture(scope="session")
+def command_and_root():
+    """uvx command and repo root, resolved once per pytest session"""
+    from ide_tools.cursor.tests.common import get_command
+    return get_command()
+
+
+@pytest.fixture(scope="session")
+def handler_session():
+    """
+    One daemon-mode handler process shared across the whole session.
+
+    Suits cases that assert on the in-band JSON reply; cases asserting
+    process exit codes still go through run_handler's fork-per-call path.
+    """
+    from ide_tools.cursor.tests.common import HandlerSession
+    session = HandlerSession()
+    yield session
+    session.close()
@@ -14,7 +14,7 @@ import sys
 import tempfile
 import uuid
 
-from common import (
+from ide_tools.cursor.tests.common import (
     get_command
 )
 from ide_tools.common.tests.asserts import assert_json_output, assert_failure
@@ -9,7 +9,7 @@ with the security API.
 import sys
 import uuid
 
-from common import (
+from ide_tools.cursor.tests.common import (
     assert_success, get_command
 )
 from ide_tools.common.tests.asserts import assert_json_output, assert_failure
@@ -32,17 +32,24 @@ def main(logger: MCPLogger, audit_logger: AuditTrailLogger, ide: str, context: O
 
     logger.info(f"IDE Tools router: ide={ide}, context={context}")
 
-    # Read stdin input once at the top level (raw string)
-    # Each handler will parse it according to its own schema
-    stdin_input = sys.stdin.read()
-
-    # Route to appropriate IDE handler with the raw input string
+    # Route to appropriate IDE handler. Single-shot handlers get the whole of
+    # stdin as raw bytes (skips the text-layer UTF-8 decode; both stdlib json
+    # and orjson parse bytes directly); daemon mode owns stdin itself and
+    # reads one newline-delimited request per line.
     if ide == "cursor":
-        from ide_tools.cursor import route_cursor_hook
-        route_cursor_hook(logger, audit_logger, stdin_input)
+        if context == "daemon":
+            from ide_tools.cursor import route_cursor_hook_stream
+            route_cursor_hook_stream(logger, audit_logger)
+        else:
+            from ide_tools.cursor import route_cursor_hook
+            route_cursor_hook(logger, audit_logger, sys.stdin.buffer.read())
     elif ide == "claude-code":
-        from ide_tools.claude_code import route_claude_code_hook
-        route_claude_code_hook(logger, audit_logger, stdin_input)
+        if context == "daemon":
+            from ide_tools.claude_code import route_claude_code_hook_stream
+            route_claude_code_hook_stream(logger, audit_logger)
+        else:
+            from ide_tools.claude_code import route_claude_code_hook
+            route_claude_code_hook(logger, audit_logger, sys.stdin.buffer.read())
     else:
         logger.error(f"Unknown IDE: {ide}")
         sys.exit(1)
@@ -14,6 +14,7 @@ Captures complete request/response lifecycles including:
 All data is automatically redacted for PII and secrets before logging.
 """
 
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -31,6 +32,13 @@ class AuditTrailLogger:
     
     Logs all data flows through the wrapper in JSON Lines format for user transparency.
     Each log entry represents one step in the sequential flow of MCP operations.
+
+    Thread safety: writes are serialized by an internal lock, so events from
+    concurrent callers (e.g. a hook's offloaded agent_request write racing the
+    policy client's synchronous log_event calls) never interleave mid-line.
+    Ordering between threads is relaxed, however: an offloaded agent_request
+    may land after the security_api_* events that share its event_id. Readers
+    should correlate by event_id rather than by line order.
     """
 
     def __init__(self, logger: MCPLogger):
@@ -45,6 +53,7 @@ class AuditTrailLogger:
         self.session_id = get_session_id()
         self.audit_file = get_audit_trail_path()
         self._pending_logs: List[Dict[str, Any]] = []  # Queue logs until app_uid is set
+        self._write_lock = threading.Lock()  # Serializes appends from concurrent callers
 
         # Ensure audit trail file directory exists
         Path(self.audit_file).parent.mkdir(parents=True, exist_ok=True)
@@ -108,23 +117,80 @@ class AuditTrailLogger:
             # Log errors to existing logger but continue operation
             self.logger.error(f"Audit trail write failed: {e}")
 
+    def log_events(
+            self,
+            event_specs: List[tuple],
+            *,
+            event_id: Optional[str] = None,
+            prompt_id: Optional[str] = None
+    ):
+        """
+        Log several audit events from one operation under a single file
+        open/flush instead of paying the append + flush per event
+
+        Args:
+            event_specs: List of (event_type, data) tuples, written in order
+            event_id: Optional event correlation ID shared by all events
+            prompt_id: Optional user prompt correlation ID shared by all events
+        """
+        try:
+            events = []
+            for event_type, data in event_specs:
+                event = {
+                    "session_id": self.session_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "event_type": event_type,
+                    "data": redact(to_dict(data))
+                }
+                if prompt_id:
+                    event["prompt_id"] = prompt_id
+                if event_id:
+                    event["event_id"] = event_id
+                events.append(event)
+
+            if self.app_uid is None:
+                self._pending_logs.extend(events)
+            else:
+                self._write_events(events)
+
+        except Exception as e:
+            self.logger.error(f"Audit trail write failed: {e}")
+
     def _write_event(self, event: Dict[str, Any]):
         """
         Write a single event to the audit trail file with app_uid as first key
-        
+
         Args:
             event: Event dict (may or may not have app_uid already)
         """
+        self._write_events([event])
+
+    def _write_events(self, events: List[Dict[str, Any]]):
+        """
+        Write events to the audit trail file under one open/flush,
+        each with app_uid as first key
+
+        The append itself runs under the write lock: buffered writes larger
+        than the stdio buffer are not atomic, so unlocked concurrent appends
+        could interleave mid-line and corrupt the JSONL trail.
+
+        Args:
+            events: Event dicts (may or may not have app_uid already)
+        """
         # Ensure app_uid is first key in the output
-        event_with_app_uid = {
-            "app_uid": self.app_uid,
-            **{k: v for k, v in event.items() if k != "app_uid"}
-        }
+        lines = [
+            safe_json_dumps({
+                "app_uid": self.app_uid,
+                **{k: v for k, v in event.items() if k != "app_uid"}
+            }) + '\n'
+            for event in events
+        ]
 
         # Atomic append to audit trail file
-        with open(self.audit_file, 'a', encoding='utf-8') as f:
-            f.write(safe_json_dumps(event_with_app_uid) + '\n')
-            f.flush()  # Force immediate write for crash safety
+        with self._write_lock:
+            with open(self.audit_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+                f.flush()  # Force immediate write for crash safety
 
     def set_app_uid(self, app_uid: str):
         """
@@ -147,11 +213,10 @@ class AuditTrailLogger:
 
         self.app_uid = app_uid
 
-        # Flush all pending logs
+        # Flush all pending logs in one write
         if self._pending_logs:
             self.logger.debug(f"Flushing {len(self._pending_logs)} queued audit logs")
-            for event in self._pending_logs:
-                self._write_event(event)
+            self._write_events(self._pending_logs)
             self._pending_logs.clear()
 
 
@@ -87,21 +87,21 @@ class MCPLogger:
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
 
-    def info(self, message: str) -> None:
-        """Log info message"""
-        self.logger.info(message)
+    def info(self, message: str, *args) -> None:
+        """Log info message (args enable lazy %-formatting)"""
+        self.logger.info(message, *args)
 
-    def error(self, message: str, exc_info: bool = False) -> None:
-        """Log error message"""
-        self.logger.error(message, exc_info=exc_info)
+    def error(self, message: str, *args, exc_info: bool = False) -> None:
+        """Log error message (args enable lazy %-formatting)"""
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def warning(self, message: str) -> None:
-        """Log warning message"""
-        self.logger.warning(message)
+    def warning(self, message: str, *args) -> None:
+        """Log warning message (args enable lazy %-formatting)"""
+        self.logger.warning(message, *args)
 
-    def debug(self, message: str) -> None:
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args) -> None:
+        """Log debug message (args enable lazy %-formatting)"""
+        self.logger.debug(message, *args)
 
     def close(self) -> None:
         """Close log file handle"""
@@ -80,6 +80,13 @@ class PIIDetector:
             ),
         }
 
+        # Single combined alternation: one pass over the text instead of one
+        # scan per entity type; the matching branch is recovered from the
+        # named group that captured
+        self._combined = re.compile(
+            '|'.join(f'(?P<{name}>{pattern.pattern})' for name, pattern in self.patterns.items())
+        )
+
     def validate_credit_card(self, number: str) -> bool:
         """Validate credit card using Luhn algorithm"""
         digits = re.sub(r'\D', '', number)  # Remove non-digits
@@ -135,31 +142,35 @@ class PIIDetector:
         """
         matches = []
 
-        # Extract other PII using regex patterns
-        for entity_type, pattern in self.patterns.items():
-            for match in pattern.finditer(text):
-                matched_text = match.group()
-
-                # Calculate base confidence
-                confidence = self._calculate_confidence(entity_type, matched_text)
-
-                # Validation gates - boost confidence for validated entities
-                if entity_type == 'CREDIT_CARD':
-                    if not self.validate_credit_card(matched_text):
-                        continue  # Skip if Luhn validation fails
-                    confidence = 0.99  # Near-certainty for validated credit cards
-
-                if entity_type == 'IBAN':
-                    if not self.validate_iban(matched_text):
-                        continue  # Skip if MOD-97 validation fails
-                    confidence = 0.99  # Near-certainty for validated IBANs
-
-                matches.append(PIIMatch(
-                    start=match.start(),
-                    end=match.end(),
-                    entity_type=entity_type,
-                    confidence=confidence
-                ))
+        # Extract other PII in a single combined-alternation pass
+        for match in self._combined.finditer(text):
+            # The named branch that captured identifies the entity type
+            # (lastgroup can point at an unnamed inner group, so scan groupdict)
+            entity_type = next(
+                name for name, value in match.groupdict().items() if value is not None
+            )
+            matched_text = match.group()
+
+            # Calculate base confidence
+            confidence = self._calculate_confidence(entity_type, matched_text)
+
+            # Validation gates - boost confidence for validated entities
+            if entity_type == 'CREDIT_CARD':
+                if not self.validate_credit_card(matched_text):
+                    continue  # Skip if Luhn validation fails
+                confidence = 0.99  # Near-certainty for validated credit cards
+
+            if entity_type == 'IBAN':
+                if not self.validate_iban(matched_text):
+                    continue  # Skip if MOD-97 validation fails
+                confidence = 0.99  # Near-certainty for validated IBANs
+
+            matches.append(PIIMatch(
+                start=match.start(),
+                end=match.end(),
+                entity_type=entity_type,
+                confidence=confidence
+            ))
 
         # Sort by start position and remove overlaps (keep highest confidence)
         return self._resolve_overlaps(matches)
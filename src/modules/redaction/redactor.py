@@ -24,6 +24,61 @@ from .pii_rules import detect_pii
 JSONPathCacheValue = Tuple[Set[str], Dict[str, Any]]
 
 
+def _required_literal_runs(pattern: re.Pattern) -> List[str]:
+    """
+    Extract literal substrings that every match of the pattern must contain.
+
+    Walks the compiled pattern's parse tree and collects contiguous literal
+    runs, descending only into constructs that are guaranteed to participate
+    in a match (non-optional groups and repeats with min >= 1). Optional
+    groups, alternations, and lookarounds contribute nothing, so the result
+    is conservative: a returned run is always present in any match.
+
+    Returns lowercased runs for case-insensitive substring checks.
+    """
+    try:
+        from re import _parser as sre_parser
+    except ImportError:  # pragma: no cover - Python < 3.11
+        import sre_parse as sre_parser
+
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush():
+        if current:
+            runs.append(''.join(current).lower())
+            current.clear()
+
+    def walk(subpattern):
+        for op, av in subpattern:
+            op_name = str(op)
+            if op_name == 'LITERAL':
+                current.append(chr(av))
+            elif op_name in ('MAX_REPEAT', 'MIN_REPEAT'):
+                min_count, _, item = av
+                flush()
+                if min_count >= 1:
+                    walk(item)
+                    flush()
+            elif op_name == 'SUBPATTERN':
+                # av = (group, add_flags, del_flags, subpattern)
+                flush()
+                walk(av[3])
+                flush()
+            else:
+                # Alternations, character classes, anchors, lookarounds, etc.
+                # guarantee nothing about literal content
+                flush()
+
+    try:
+        walk(sre_parser.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return []
+    flush()
+
+    return runs
+
+
 class LRUCache:
     """
     Least Recently Used cache with size limit to prevent unbounded memory growth.
@@ -94,6 +149,30 @@ class RedactionEngine:
         'path_brackets': re.compile(r'\.\[(\d+)\]')
     }
 
+    # Lazily-computed set of rule indices eligible for keyword prefiltering
+    _prefilterable_rules: Optional[frozenset] = None
+
+    @staticmethod
+    def _get_prefilterable_rules(gitleaks_rules) -> frozenset:
+        """
+        Rule indices where a keyword is a required literal of the pattern, so any
+        match is guaranteed to contain that keyword and a cheap substring check
+        on the lowercased text can skip the regex engine. Rules that can match
+        text without their keywords (e.g. bare high-entropy values whose
+        keywords refer to surrounding context) must not be prefiltered -
+        redaction scans individual values, not whole files.
+        """
+        if RedactionEngine._prefilterable_rules is None:
+            prefilterable = set()
+            for idx, (_, regex, _, keywords) in enumerate(gitleaks_rules.COMPILED_RULES):
+                if not keywords:
+                    continue
+                required_runs = _required_literal_runs(regex)
+                if any(keyword in run for run in required_runs for keyword in keywords):
+                    prefilterable.add(idx)
+            RedactionEngine._prefilterable_rules = frozenset(prefilterable)
+        return RedactionEngine._prefilterable_rules
+
     @staticmethod
     def redact(value: Any, ignored_keys: List[str] = None, include_keys: List[str] = None) -> Any:
         """
@@ -170,13 +249,32 @@ class RedactionEngine:
         # Use compiled rules (based on Gitleaks patterns) for secrets detection
         from . import gitleaks_rules as GL
 
+        prefilterable = RedactionEngine._get_prefilterable_rules(GL)
+
+        # Whole-text prefilter first: a prefilterable rule whose keywords
+        # appear nowhere in the text cannot match on any line, so drop it
+        # before the per-line loop. For typical non-sensitive content this
+        # reduces the scan to one substring search per keyword over the text.
+        text_lower = text.lower()
+        active_singleline_indices = [
+            idx for idx in GL.SINGLELINE_PATTERN_INDICES
+            if idx not in prefilterable
+            or any(keyword in text_lower for keyword in GL.COMPILED_RULES[idx][3])
+        ]
+
         # Process single-line patterns line-by-line for performance and to reduce pathological matches
         offset = 0
         for line in text.split('\n'):
             line_lower = line.lower()
 
-            for idx in GL.SINGLELINE_PATTERN_INDICES:
-                _, regex, secret_group, _ = GL.COMPILED_RULES[idx]
+            for idx in active_singleline_indices:
+                _, regex, secret_group, keywords = GL.COMPILED_RULES[idx]
+
+                # Literal prefilter: a prefilterable rule can only match if one
+                # of its keyword anchors is present, and substring search is far
+                # cheaper than running the regex engine on the no-match case
+                if idx in prefilterable and not any(keyword in line_lower for keyword in keywords):
+                    continue
 
                 for match in regex.finditer(line):
                     # Use the specified group, or fall back to group 0 if it doesn't exist
@@ -202,7 +300,11 @@ class RedactionEngine:
         # Process multiline patterns on full text
         # These patterns use [\s\S] or [\r\n] and need to match across lines
         for idx in GL.MULTILINE_PATTERN_INDICES:
-            _, regex, secret_group, _ = GL.COMPILED_RULES[idx]
+            _, regex, secret_group, keywords = GL.COMPILED_RULES[idx]
+
+            # Same literal prefilter as the single-line pass, on the full text
+            if idx in prefilterable and not any(keyword in text_lower for keyword in keywords):
+                continue
 
             for match in regex.finditer(text):
                 try:
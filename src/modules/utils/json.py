@@ -9,6 +9,33 @@ from typing import Any
 from jsonc_parser.parser import JsoncParser
 from pydantic import BaseModel, AnyUrl
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson parses str/bytes directly and is significantly faster than stdlib json
+    fast_json_loads = orjson.loads
+
+    # Serializer returning UTF-8 bytes (orjson's native output - no encode step)
+    fast_json_dumps_bytes = orjson.dumps
+
+    def fast_json_dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string using orjson"""
+        return orjson.dumps(obj).decode()
+
+    # Exception tuple for except clauses - orjson raises its own JSONDecodeError
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+else:
+    fast_json_loads = json.loads
+    fast_json_dumps = json.dumps
+    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+    def fast_json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        return json.dumps(obj).encode('utf-8')
+
 
 def to_dict(value: Any) -> Any:
     """
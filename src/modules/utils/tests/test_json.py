@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List
 
-from modules.utils.json import safe_json_dumps
+from modules.utils.json import safe_json_dumps, fast_json_loads, fast_json_dumps, JSON_DECODE_ERRORS
 from pydantic import BaseModel
 
 
@@ -113,5 +113,25 @@ class TestSafeJsonDumps(unittest.TestCase):
         self.assertEqual(expected, result)
 
 
+class TestFastJson(unittest.TestCase):
+    """Tests for the orjson-backed `fast_json_loads`/`fast_json_dumps` helpers."""
+
+    def test_fast_json_round_trip(self):
+        """Test that dumps/loads round-trips a nested dict."""
+        data = {"key": "value", "nested": {"items": [1, 2, 3]}, "flag": True}
+        result = fast_json_loads(fast_json_dumps(data))
+        self.assertEqual(data, result)
+
+    def test_fast_json_loads_accepts_bytes(self):
+        """Test parsing directly from bytes input."""
+        result = fast_json_loads(b'{"key": "value"}')
+        self.assertEqual({"key": "value"}, result)
+
+    def test_fast_json_loads_invalid_input(self):
+        """Test that invalid JSON raises an error covered by JSON_DECODE_ERRORS."""
+        with self.assertRaises(JSON_DECODE_ERRORS):
+            fast_json_loads("not valid json")
+
+
 if __name__ == "__main__":
     unittest.main()